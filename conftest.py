@@ -1,8 +1,10 @@
 import pytest
 from lxml import etree
 
+_CEI_PARSER = etree.XMLParser(collect_ids=False, remove_blank_text=True, huge_tree=True)
 
-@pytest.fixture
+
+@pytest.fixture(scope="session")
 def valid_cei():
     return etree.fromstring(
         """<cei:text xmlns:cei="http://www.monasterium.net/NS/cei" b_name="Schotten, OSB" id="217593" n="Schotten, OSB$103" type="charter">
@@ -53,10 +55,11 @@ def valid_cei():
 	   <cei:persName reg="Heinrich, Schreiber des Breitenfelder">Hainrichen des praitenvelder Schreiber</cei:persName>
 	   <cei:divNotes></cei:divNotes>
 	</cei:back>
- </cei:text>"""
+ </cei:text>""",
+        _CEI_PARSER,
     )
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def invalid_cei():
-    return etree.fromstring("<notCei>This is not valid CEI</notCei>")
+    return etree.fromstring("<notCei>This is not valid CEI</notCei>", _CEI_PARSER)
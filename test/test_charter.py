@@ -1,18 +1,24 @@
 import pathlib
+import pickle
+from copy import deepcopy
 from datetime import datetime
+from io import BytesIO
 from typing import List
+from urllib.parse import quote
 
 import pytest
 from astropy.time.core import Time
 from lxml import etree
 
 from pytest_helpers import xp, xps
-from to_cei.charter import NO_DATE_TEXT, NO_DATE_VALUE, Charter
+from to_cei.charter import (NO_DATE_TEXT, NO_DATE_VALUE, Charter, fast_quote,
+                            string_to_date)
 from to_cei.config import (CEI, CHARTER_NSS, SCHEMA_LOCATION,
                            SCHEMA_LOCATION_QNAME)
 from to_cei.helpers import ln
 from to_cei.seal import Seal
 from to_cei.validator import Validator
+from to_cei.xml_assembler import XmlAssembler
 
 # --------------------------------------------------------------------#
 #                         Charter as a whole                         #
@@ -89,6 +95,15 @@ def test_writes_correct_file(tmp_path):
     Validator().validate_cei(written.getroot())
 
 
+def test_warns_about_deprecated_inclusive_ns_prefixes(tmp_path):
+    charter = Charter("1A")
+    with pytest.warns(DeprecationWarning):
+        XmlAssembler.to_file(
+            charter, "1A.cei", folder=tmp_path, inclusive_ns_prefixes=["cei"]
+        )
+    assert pathlib.Path(tmp_path, "1A.cei.xml").is_file()
+
+
 def test_add_schema_location_is_respected():
     charter = Charter("1A")
     assert (
@@ -98,6 +113,161 @@ def test_add_schema_location_is_respected():
     assert charter.to_xml(add_schema_location=False).get(SCHEMA_LOCATION_QNAME) == None
 
 
+def test_returns_independent_xml_copies():
+    charter = Charter("1A", abstract="An abstract")
+    first = charter.to_xml()
+    first.clear()
+    second = charter.to_xml()
+    assert first is not second
+    assert len(second) == 3
+    assert charter.to_string() == etree.tostring(second, encoding="unicode")
+
+
+def test_keeps_xml_content_when_serializing_repeatedly():
+    charter = Charter("1A", abstract=CEI.abstract("An abstract"))
+    first = charter.to_xml()
+    charter.to_string()
+    charter.to_bytes()
+    second = charter.to_xml()
+    for xml in [first, second]:
+        assert xml.xpath(
+            "cei:body/cei:chDesc/cei:abstract/text()", namespaces=CHARTER_NSS
+        ) == ["An abstract"]
+
+
+def test_pretty_prints_only_on_request():
+    charter = Charter("1A", abstract="An abstract")
+    assert "\n" not in charter.to_string()
+    assert charter.to_string(pretty=True) == etree.tostring(
+        charter.to_xml(), encoding="unicode", pretty_print=True
+    )
+
+
+def test_serializes_to_utf8_bytes():
+    charter = Charter("1A", abstract="Konrad von Lintz, Caplan zu St. Pankraz")
+    assert charter.to_bytes() == charter.to_string().encode("utf-8")
+
+
+def test_creates_charters_from_records():
+    records = [
+        {"id_text": "1", "date_value": "1307-02-22"},
+        {"id_text": "2", "date_value": ("1307-02-22T10:00", "1307-03-01T10:00")},
+        {"id_text": "3", "date_value": "13070222"},
+        {"id_text": "4", "abstract": "Konrad von Lintz"},
+    ]
+    charters = Charter.from_records(records)
+    assert [charter.to_string() for charter in charters] == [
+        Charter(**record).to_string() for record in records
+    ]
+    assert charters[1].date_value == (
+        Time("1307-02-22T10:00", format="isot", scale="ut1"),
+        Time("1307-03-01T10:00", format="isot", scale="ut1"),
+    )
+
+
+def test_raises_exception_for_invalid_records():
+    with pytest.raises(ValueError):
+        Charter.from_records(
+            [
+                {"id_text": "1", "date_value": "1307-02-22"},
+                {"id_text": "2", "date_value": "1307-02-30"},
+            ]
+        )
+
+
+def test_writes_to_file_object():
+    charter = Charter("1A", abstract="Konrad von Lintz, Caplan zu St. Pankraz")
+    file = BytesIO()
+    charter.write(file)
+    file.write(b"\n")
+    charter.write(file, pretty=False)
+    declaration = b"<?xml version='1.0' encoding='UTF-8' standalone='no'?>\n"
+    assert file.getvalue() == (
+        declaration
+        + charter.to_bytes(pretty=True)
+        + b"\n"
+        + declaration
+        + charter.to_bytes()
+    )
+
+
+def test_updates_xml_after_setting_a_property():
+    charter = Charter("1A", abstract="An abstract")
+    assert "An abstract" in charter.to_string()
+    charter.abstract = "Another abstract"
+    assert "Another abstract" in charter.to_string()
+    assert xps(charter, "/cei:text/cei:body/cei:chDesc/cei:abstract").text == (
+        "Another abstract"
+    )
+
+
+def test_does_not_allow_changing_lists_in_place():
+    charter = Charter("1A", abstract_sources=["Bibl a"], issuers=["Konrad von Lintz"])
+    charter.to_string()
+    with pytest.raises(AttributeError):
+        charter.abstract_sources.append("Bibl b")  # type: ignore
+    charter.abstract_sources = [*charter.abstract_sources, "Bibl b"]
+    sources = xp(charter, "/cei:text/cei:front/cei:sourceDesc/cei:sourceDescRegest/*")
+    assert [source.text for source in sources] == ["Bibl a", "Bibl b"]
+
+
+def test_does_not_share_lists_with_the_caller():
+    issuers = ["Konrad von Lintz"]
+    seals = ["Seal 1"]
+    charter = Charter("1A", abstract="An abstract", issuers=issuers, seals=seals)
+    string = charter.to_string()
+    issuers.append("Thomas von Gmunden")
+    seals.append("Seal 2")
+    assert charter.to_string() == string
+    # Setting any property rebuilds the xml from the stored values
+    charter.language = None
+    assert charter.to_string() == string
+
+
+def test_updates_xml_after_setting_a_changed_element_again():
+    abstract = CEI.abstract("An abstract")
+    charter = Charter("1A", abstract=abstract)
+    charter.to_string()
+    abstract.text = "Another abstract"
+    # The string and the tree are taken from the same cached xml
+    assert "An abstract" in charter.to_string()
+    assert xps(charter, "/cei:text/cei:body/cei:chDesc/cei:abstract").text == (
+        "An abstract"
+    )
+    charter.abstract = abstract
+    assert "Another abstract" in charter.to_string()
+    assert xps(charter, "/cei:text/cei:body/cei:chDesc/cei:abstract").text == (
+        "Another abstract"
+    )
+
+
+def test_pickles_serialized_charter():
+    charter = Charter("1A", abstract="An abstract", date_value="13070222")
+    string = charter.to_string()
+    charter.date_value
+    copy = pickle.loads(pickle.dumps(charter))
+    assert copy.to_string() == string
+    assert copy.date_value == charter.date_value
+
+
+def test_keeps_elements_shared_between_charters():
+    person = CEI.persName("Konrad von Lintz")
+    charter_a = Charter("1A", index_persons=[person])
+    charter_b = Charter("1B", index_persons=[person])
+    charter_a.to_xml()
+    charter_b.to_xml()
+    assert "Konrad von Lintz" in charter_a.to_string()
+    assert "Konrad von Lintz" in charter_b.to_string()
+
+
+def test_has_no_instance_dict():
+    charter = Charter("1A")
+    assert not hasattr(charter, "__dict__")
+    with pytest.raises(AttributeError):
+        charter.unknown = "value"  # type: ignore
+    assert deepcopy(charter).to_string() == charter.to_string()
+
+
 # --------------------------------------------------------------------#
 #                          Charter abstract                          #
 # --------------------------------------------------------------------#
@@ -174,7 +344,7 @@ def test_has_correct_abstract_bibl():
         id_text="1",
         abstract_sources=bibl_text,
     )
-    assert isinstance(charter.abstract_sources, List)
+    assert isinstance(charter.abstract_sources, tuple)
     bibl = xps(charter, "/cei:text/cei:front/cei:sourceDesc/cei:sourceDescRegest/*")
     assert bibl.text == bibl_text
 
@@ -205,13 +375,26 @@ def test_has_correct_abstract_sources():
     assert sources[1].text == bibl_texts[1]
 
 
+def test_escapes_special_characters_in_abstract_sources():
+    bibl_texts = ["Bibl <a> & 'a'\r\n\"b\"", "Bibl <b>"]
+    charter = Charter(id_text="1", abstract_sources=bibl_texts)
+    sources = xp(charter, "/cei:text/cei:front/cei:sourceDesc/cei:sourceDescRegest/*")
+    assert [source.text for source in sources] == bibl_texts
+    assert charter.to_string().count("<cei:bibl>Bibl &lt;a&gt; &amp; 'a'&#13;") == 1
+
+
+def test_rejects_invalid_characters_in_abstract_sources():
+    with pytest.raises(ValueError):
+        Charter(id_text="1", abstract_sources=["Bibl \x00"]).to_xml()
+
+
 def test_has_correct_transcription_source():
     bibl_text = "Bibl a"
     charter = Charter(
         id_text="1",
         transcription_sources=bibl_text,
     )
-    assert isinstance(charter.transcription_sources, List)
+    assert isinstance(charter.transcription_sources, tuple)
     sources = xps(
         charter, "/cei:text/cei:front/cei:sourceDesc/cei:sourceDescVolltext/*"
     )
@@ -249,7 +432,7 @@ def test_has_correct_transcription_sources():
 def test_has_correct_single_chancellary_remark():
     chancellary_remarks = "Remark"
     charter = Charter(id_text="1", chancellary_remarks=chancellary_remarks)
-    assert isinstance(charter.chancellary_remarks, List)
+    assert isinstance(charter.chancellary_remarks, tuple)
     assert charter.chancellary_remarks[0] == chancellary_remarks
     nota = xps(charter, "/cei:text/cei:body/cei:chDesc/cei:witnessOrig/cei:nota")
     assert nota.text == chancellary_remarks
@@ -258,7 +441,7 @@ def test_has_correct_single_chancellary_remark():
 def test_has_correct_chancellary_remarks_list():
     chancellary_remarks = ["Remark a", "Remark b"]
     charter = Charter(id_text="1", chancellary_remarks=chancellary_remarks)
-    assert charter.chancellary_remarks == chancellary_remarks
+    assert charter.chancellary_remarks == tuple(chancellary_remarks)
     nota = xp(charter, "/cei:text/cei:body/cei:chDesc/cei:witnessOrig/cei:nota")
     assert len(nota) == 2
     assert nota[0].text == chancellary_remarks[0]
@@ -279,7 +462,7 @@ def test_has_no_chancellary_remarks_for_empty_text():
 def test_has_correct_comments():
     comments = ["Comment a", "Comment b"]
     charter = Charter(id_text="1", comments=comments)
-    assert charter.comments == comments
+    assert charter.comments == tuple(comments)
     paragraphs = xp(
         charter,
         "/cei:text/cei:body/cei:chDesc/cei:diplomaticAnalysis/cei:p",
@@ -379,6 +562,16 @@ def test_has_correct_date_with_99_as_day():
     assert date_xml.get("to") == "14000228"
 
 
+def test_has_correct_date_with_negative_mom_year():
+    charter = Charter(id_text="1", date_value="-0500301")
+    assert charter.date_value == Time(
+        {"year": -50, "month": 3, "day": 1}, format="ymdhms", scale="ut1"
+    )
+    date_xml = xps(charter, "/cei:text/cei:body/cei:chDesc/cei:issued/cei:date")
+    assert date_xml.text == "-00050-03-01"
+    assert date_xml.get("value") == "-0500301"
+
+
 def test_has_correct_leap_year_date_with_99_as_day():
     charter = Charter(id_text="1", date_value="14040299")
     assert charter.date_value == (
@@ -507,6 +700,36 @@ def test_has_correct_empty_date_text():
     assert date_xml.get("value") == "13420112"
 
 
+def test_keeps_isot_format_for_iso_date_values():
+    charter = Charter("1A", date_value="1307-02-22")
+    assert charter.date_value.format == "isot"
+    assert charter.date_value.value == "1307-02-22T00:00:00.000"
+    start, end = Charter("1B", date_value=("1307-02-22", "1307-03-01")).date_value
+    assert (start.format, end.format) == ("isot", "isot")
+    assert end.value == "1307-03-01T00:00:00.000"
+
+
+def test_does_not_share_date_values_parsed_from_the_same_string():
+    charter_a = Charter("1A", date_value="1307-02-22T10:00")
+    charter_b = Charter("1B", date_value="1307-02-22T10:00")
+    assert charter_a.date_value is not charter_b.date_value
+    charter_a.date_value.format = "jd"
+    assert charter_b.date_value.format == "isot"
+
+
+def test_does_not_allow_changing_parsed_mom_dates():
+    date = string_to_date("12340512")
+    with pytest.raises(AttributeError):
+        date.year = 1  # type: ignore
+    start, end = string_to_date("12349999")  # type: ignore
+    with pytest.raises(AttributeError):
+        end.month = 1
+    assert string_to_date("12340512").year == 1234  # type: ignore
+    assert string_to_date("12349999")[1].month == 12  # type: ignore
+    charter = Charter("1A", date_value="12340512")
+    assert xps(charter, "//cei:date").get("value") == "12340512"
+
+
 def test_has_correct_empty_date_value():
     text = "Sine dato"
     charter = Charter(id_text="1", date=text)
@@ -575,6 +798,11 @@ def test_raises_exception_for_invalid_date_value_in_mom_format():
         )
 
 
+def test_raises_exception_for_invalid_month_in_mom_format():
+    with pytest.raises(ValueError):
+        Charter(id_text="1", date="in 1789", date_value="17981301")
+
+
 def test_raises_exception_for_incorrect_date_value_pair():
     with pytest.raises(ValueError):
         Charter(
@@ -584,6 +812,15 @@ def test_raises_exception_for_incorrect_date_value_pair():
         )
 
 
+def test_raises_exception_for_mixed_date_value_pair():
+    with pytest.raises(ValueError):
+        Charter(
+            id_text="1",
+            date="in 1789",
+            date_value=("17980101", "1798-12-31"),
+        )
+
+
 def test_raises_exception_for_incorrect_xml_date():
     incorrect_element = CEI.persName("A person")
     with pytest.raises(ValueError):
@@ -698,7 +935,7 @@ def test_raises_exception_for_invalid_external_link():
 def test_has_correct_list_graphic_urls():
     graphic_urls = ["Figure 1.jgp", "figure_2.png"]
     charter = Charter(id_text="1", graphic_urls=graphic_urls)
-    assert charter.graphic_urls == graphic_urls
+    assert charter.graphic_urls == tuple(graphic_urls)
     graphics_xml = xp(
         charter, "/cei:text/cei:body/cei:chDesc/cei:witnessOrig/cei:figure/cei:graphic"
     )
@@ -731,7 +968,7 @@ def test_has_empty_graphic_urls_for_empty_text():
 def test_has_correct_footnotes():
     footnotes = ["Footnote a", "Footnote b"]
     charter = Charter(id_text="1", footnotes=footnotes)
-    assert charter._footnotes == footnotes
+    assert charter._footnotes == tuple(footnotes)
     notes = xp(
         charter,
         "/cei:text/cei:back/cei:divNotes/cei:note",
@@ -780,6 +1017,21 @@ def test_has_correct_id_norm_for_empty_text():
     assert charter.id_norm == id
 
 
+def test_updates_id_norm_after_changing_ids():
+    charter = Charter(id_text="1307 II 22")
+    assert charter.id_norm == "1307%20II%2022"
+    charter.id_text = "1307 II 23"
+    assert charter.id_norm == "1307%20II%2023"
+    charter.id_norm = "1307_II_23"
+    assert charter.id_norm == "1307_II_23"
+    assert xps(charter, "/cei:text/cei:body/cei:idno").get("id") == "1307_II_23"
+
+
+def test_fast_quote_matches_quote():
+    for value in ["1307_II_22", "a/b.c-d~e", "1307 II 22", "~!1307 II 22|23.Ⅱ", ""]:
+        assert fast_quote(value) == quote(value)
+
+
 def test_has_correct_id_old():
     id_old = "123456 α"
     idno = xps(
@@ -809,7 +1061,7 @@ def test_has_correct_index_geo_features():
         CEI.geogName("Geo feature b"),
     ]
     charter = Charter(id_text="1", index_geo_features=index_geo_features)
-    assert charter.index_geo_features == index_geo_features
+    assert charter.index_geo_features == tuple(index_geo_features)
     geog_names_xml = xp(charter, "/cei:text/cei:back/cei:geogName")
     assert len(geog_names_xml) == 2
     assert geog_names_xml[0].text == index_geo_features[0]
@@ -833,7 +1085,7 @@ def test_has_correct_index_terms():
         CEI.index("Term b"),
     ]
     charter = Charter(id_text="1", index=index)
-    assert charter.index == index
+    assert charter.index == tuple(index)
     index_xml = xp(charter, "/cei:text/cei:back/cei:index")
     assert len(index_xml) == 2
     assert index_xml[0].text == index[0]
@@ -854,7 +1106,7 @@ def test_has_correct_index_organizations():
         CEI.orgName("Organization b"),
     ]
     charter = Charter(id_text="1", index_organizations=index_organizations)
-    assert charter.index_organizations == index_organizations
+    assert charter.index_organizations == tuple(index_organizations)
     organization_names_xml = xp(charter, "/cei:text/cei:back/cei:orgName")
     assert len(organization_names_xml) == 2
     assert organization_names_xml[0].text == index_organizations[0]
@@ -879,7 +1131,7 @@ def test_has_correct_index_persons():
         CEI.persName("Person c", {"type": "Custom Type"}),
     ]
     charter = Charter(id_text="1", index_persons=index_persons)
-    assert charter.index_persons == index_persons
+    assert charter.index_persons == tuple(index_persons)
     pers_names_xml = xp(charter, "/cei:text/cei:back/cei:persName")
     assert len(pers_names_xml) == 3
     assert pers_names_xml[0].text == index_persons[0]
@@ -902,7 +1154,7 @@ def test_has_correct_index_places():
         CEI.placeName("Place b"),
     ]
     charter = Charter(id_text="1", index_places=index_places)
-    assert charter.index_places == index_places
+    assert charter.index_places == tuple(index_places)
     place_names_xml = xp(charter, "/cei:text/cei:back/cei:placeName")
     assert len(place_names_xml) == 2
     assert place_names_xml[0].text == index_places[0]
@@ -989,8 +1241,8 @@ def test_has_correct_abstract_with_text_list_issuer():
     )
     issuers = ["Konrad von Lintz", "Thomas von Gmunden"]
     charter = Charter(id_text="1", abstract=abstract, issuers=issuers)
-    assert isinstance(charter.issuers, List)
-    assert charter.issuers == issuers
+    assert isinstance(charter.issuers, tuple)
+    assert charter.issuers == tuple(issuers)
     issuer_xml = xp(charter, "/cei:text/cei:body/cei:chDesc/cei:abstract/cei:issuer")
     assert issuer_xml[0].text == issuers[0]
     assert issuer_xml[1].text == issuers[1]
@@ -1015,7 +1267,7 @@ def test_has_correct_abstract_with_xml_issuer_list():
     )
     issuers = [CEI.issuer("Konrad von Lintz"), CEI.issuer("Thomas von Gmunden")]
     charter = Charter(id_text="1", abstract=abstract, issuers=issuers)
-    assert isinstance(charter.issuers, List)
+    assert isinstance(charter.issuers, tuple)
     assert isinstance(charter.issuers[0], etree._Element)
     assert isinstance(charter.issuers[1], etree._Element)
     assert charter.issuers[0].text == issuers[0].text
@@ -1072,7 +1324,7 @@ def test_has_no_language_for_empty_string():
 def test_has_correct_literature():
     literature = ["Entry 1", "Entry 2"]
     charter = Charter(id_text="1", literature=literature)
-    assert charter.literature == literature
+    assert charter.literature == tuple(literature)
     literature_xml = xp(
         charter,
         "/cei:text/cei:body/cei:chDesc/cei:diplomaticAnalysis/cei:listBibl/cei:bibl",
@@ -1091,7 +1343,7 @@ def test_has_no_literature_for_empty_text():
 def test_has_correct_literature_abstracts():
     literature_abstracts = ["Entry 1", "Entry 2"]
     charter = Charter(id_text="1", literature_abstracts=literature_abstracts)
-    assert charter.literature_abstracts == literature_abstracts
+    assert charter.literature_abstracts == tuple(literature_abstracts)
     literature_abstracts_xml = xp(
         charter,
         "/cei:text/cei:body/cei:chDesc/cei:diplomaticAnalysis/cei:listBiblRegest/cei:bibl",
@@ -1110,7 +1362,7 @@ def test_has_no_literature_abstracts_for_empty_text():
 def test_has_correct_literature_depictions():
     literature_depictions = ["Entry 1", "Entry 2"]
     charter = Charter(id_text="1", literature_depictions=literature_depictions)
-    assert charter.literature_depictions == literature_depictions
+    assert charter.literature_depictions == tuple(literature_depictions)
     literature_depictions_xml = xp(
         charter,
         "/cei:text/cei:body/cei:chDesc/cei:diplomaticAnalysis/cei:listBiblFaksimile/cei:bibl",
@@ -1129,7 +1381,7 @@ def test_has_no_literature_depictions_for_empty_text():
 def test_has_correct_literature_editions():
     literature_editions = ["Entry 1", "Entry 2"]
     charter = Charter(id_text="1", literature_editions=literature_editions)
-    assert charter.literature_editions == literature_editions
+    assert charter.literature_editions == tuple(literature_editions)
     literature_editions_xml = xp(
         charter,
         "/cei:text/cei:body/cei:chDesc/cei:diplomaticAnalysis/cei:listBiblEdition/cei:bibl",
@@ -1148,7 +1400,7 @@ def test_has_no_literature_editions_for_empty_text():
 def test_has_correct_literature_secondary():
     literature_secondary = ["Entry 1", "Entry 2"]
     charter = Charter(id_text="1", literature_secondary=literature_secondary)
-    assert charter.literature_secondary == literature_secondary
+    assert charter.literature_secondary == tuple(literature_secondary)
     literature_secondary_xml = xp(
         charter,
         "/cei:text/cei:body/cei:chDesc/cei:diplomaticAnalysis/cei:listBiblErw/cei:bibl",
@@ -1317,7 +1569,7 @@ def test_has_correct_seal_text_description():
 def test_has_correct_multiple_seal_text_descriptions():
     seals = ["Seal 1", "Seal 2"]
     charter = Charter(id_text="1", seals=seals)
-    assert charter.seals == seals
+    assert charter.seals == tuple(seals)
     seals_xml = xp(
         charter,
         "/cei:text/cei:body/cei:chDesc/cei:witnessOrig/cei:auth/cei:sealDesc/cei:seal",
@@ -1349,7 +1601,7 @@ def test_has_correct_multiple_seal_objects():
         Seal(material="Material b", sigillant="Sigillant b"),
     ]
     charter = Charter(id_text="1", seals=seals)
-    assert charter.seals == seals
+    assert charter.seals == tuple(seals)
     seals_xml = xp(
         charter,
         "/cei:text/cei:body/cei:chDesc/cei:witnessOrig/cei:auth/cei:sealDesc/cei:seal",
@@ -1447,7 +1699,7 @@ def test_has_correct_witnesses():
         CEI.persName("Witness c", {"type": "Zeuge"}),
     ]
     charter = Charter(id_text="1", witnesses=witnesses)
-    assert charter.witnesses == witnesses
+    assert charter.witnesses == tuple(witnesses)
     pers_names_xml = xp(charter, '/cei:text/cei:back/cei:persName[@type="Zeuge"]')
     assert len(pers_names_xml) == 3
     assert pers_names_xml[0].text == witnesses[0]
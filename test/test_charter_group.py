@@ -36,3 +36,10 @@ def test_add_schema_location_is_respected():
 def test_raises_exception_for_empty_name():
     with pytest.raises(ValueError):
         CharterGroup("")
+
+
+def test_does_not_share_default_charters():
+    first = CharterGroup("First group")
+    first.charters.append(Charter("1A"))
+    second = CharterGroup("Second group")
+    assert second.charters == []
@@ -0,0 +1,91 @@
+import os
+from typing import Optional
+
+import requests
+
+from to_cei.filecache import REVALIDATE_TIMEOUT, FileCache
+
+
+def test_returns_local_file_content(tmp_path):
+    path = tmp_path.joinpath("schema.xsd")
+    path.write_text("<schema>\n  <element/>\n</schema>", encoding="utf-8")
+    cache = FileCache(str(tmp_path.joinpath("cache")))
+    assert cache.get(str(path)) == "<schema>\n  <element/>\n</schema>"
+
+
+def test_rereads_changed_local_file(tmp_path):
+    path = tmp_path.joinpath("schema.xsd")
+    path.write_text("<schema/>", encoding="utf-8")
+    cache = FileCache(str(tmp_path.joinpath("cache")))
+    assert cache.get(str(path)) == "<schema/>"
+    path.write_text("<changed-schema/>", encoding="utf-8")
+    os.utime(path, ns=(0, 0))
+    assert cache.get(str(path)) == "<changed-schema/>"
+
+
+def test_compiles_schema_only_once(tmp_path):
+    path = tmp_path.joinpath("schema.xsd")
+    path.write_text(
+        '<xs:schema xmlns:xs="http://www.w3.org/2001/XMLSchema"><xs:element name="root"/></xs:schema>',
+        encoding="utf-8",
+    )
+    cache = FileCache(str(tmp_path.joinpath("cache")))
+    schema = cache.get_schema(str(path))
+    assert schema is not None
+    assert schema.is_valid("<root/>")
+    assert not schema.is_valid("<other/>")
+    assert cache.get_schema(str(path)) is schema
+
+
+class _Response:
+    def __init__(self, status_code: int, text: str, headers: Optional[dict] = None):
+        self.status_code = status_code
+        self.text = text
+        self.headers = headers if headers is not None else {}
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        pass
+
+
+def test_revalidates_cached_url_once_per_session(tmp_path, monkeypatch):
+    url = "https://example.com/schema.xsd"
+    requests_arguments = []
+
+    def get(url, headers=None, timeout=None):
+        requests_arguments.append((headers, timeout))
+        if headers is not None and "If-Modified-Since" in headers:
+            return _Response(304, "")
+        return _Response(
+            200, "<schema/>", {"Last-Modified": "Tue, 01 Oct 2024 00:00:00 GMT"}
+        )
+
+    monkeypatch.setattr("to_cei.filecache.requests.get", get)
+    assert FileCache(str(tmp_path)).get(url) == "<schema/>"
+    cache = FileCache(str(tmp_path))
+    assert cache.get(url) == "<schema/>"
+    assert cache.get(url) == "<schema/>"
+    assert requests_arguments == [
+        (None, None),
+        (
+            {"If-Modified-Since": "Tue, 01 Oct 2024 00:00:00 GMT"},
+            REVALIDATE_TIMEOUT,
+        ),
+    ]
+
+
+def test_keeps_cached_url_if_revalidation_times_out(tmp_path, monkeypatch):
+    url = "https://example.com/schema.xsd"
+
+    def get(url, headers=None, timeout=None):
+        if headers is not None and "If-Modified-Since" in headers:
+            raise requests.Timeout()
+        return _Response(
+            200, "<schema/>", {"Last-Modified": "Tue, 01 Oct 2024 00:00:00 GMT"}
+        )
+
+    monkeypatch.setattr("to_cei.filecache.requests.get", get)
+    assert FileCache(str(tmp_path)).get(url) == "<schema/>"
+    assert FileCache(str(tmp_path)).get(url) == "<schema/>"
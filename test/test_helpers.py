@@ -1,15 +1,18 @@
+import pytest
 from lxml import etree
 
 from to_cei.config import CEI, CEI_NS
-from to_cei.helpers import join, ln, ns
+from to_cei.helpers import get_str_list, get_str_or_element, join, ln, ns
 
 
 def test_gets_correct_local_name():
     assert ln(CEI.text()) == "text"
+    assert ln(etree.Element("text")) == "text"
 
 
 def test_gets_correct_namespace():
     assert ns(CEI.text()) == CEI_NS
+    assert ns(etree.Element("text")) is None
 
 
 def test_joins_correctly():
@@ -21,3 +24,24 @@ def test_joins_correctly():
     assert etree.tostring(joined[1]) == etree.tostring(CEI.persName())
     assert etree.tostring(joined[2]) == etree.tostring(CEI.placeName())
     assert etree.tostring(joined[3]) == etree.tostring(CEI.persName())
+
+
+def test_gets_correct_str_list():
+    assert get_str_list(None) == []
+    assert get_str_list("") == []
+    assert get_str_list("A") == ["A"]
+    assert get_str_list(["A", "B"]) == ["A", "B"]
+    assert get_str_list(("A", "B")) == ["A", "B"]
+    assert get_str_list(text for text in ["A", "B"]) == ["A", "B"]
+
+
+def test_validates_str_or_element():
+    assert get_str_or_element(None, "issuer") is None
+    assert get_str_or_element("", "issuer") is None
+    assert get_str_or_element("A", "issuer") == "A"
+    issuer = CEI.issuer("A")
+    assert get_str_or_element(issuer, "abstract", "issuer") is issuer
+    with pytest.raises(ValueError, match="CEI namespace"):
+        get_str_or_element(etree.Element("issuer"), "issuer")
+    with pytest.raises(ValueError, match="one of 'abstract'"):
+        get_str_or_element(issuer, "abstract")
@@ -1,49 +1,242 @@
+from __future__ import annotations
+
 import calendar
 import re
+import string
+import sys
 import warnings
+from copy import deepcopy
 from datetime import datetime
-from typing import List, Optional, Tuple
+from functools import lru_cache
+from typing import TYPE_CHECKING, Any, Dict, Iterable, List, Optional, Tuple, Union
 from urllib.parse import quote
 
-from astropy.time import Time
 from lxml import etree
 
-from to_cei.config import CEI, CEI_SCHEMA_LOCATION_ATTRIBUTE
+from to_cei.config import CEI_NS, CEI_SCHEMA_LOCATION_ATTRIBUTE, CHARTER_NSS
 from to_cei.helpers import (get_str, get_str_list, get_str_or_element,
-                            get_str_or_element_list, join)
+                            get_str_or_element_list)
 from to_cei.seal import Seal
 from to_cei.xml_assembler import XmlAssembler
 
+if TYPE_CHECKING:
+    from astropy.time import Time
+
 MOM_DATE_REGEX = re.compile(
     r"^(?P<year>-?[129]?[0-9][0-9][0-9])(?P<month>[019][0-9])(?P<day>[01239][0-9])$"
 )
 NO_DATE_TEXT = "No date"
 NO_DATE_VALUE = "99999999"
 
+# Earliest year astropy.Time can represent in the ymdhms format
+_MIN_YEAR = -4799
+
 SIMPLE_URL_REGEX = re.compile(r"^https?://.{1,}\..{1,}$")
 
-Date = str | datetime | Time
+# Characters that urllib.parse.quote leaves untouched with its default safe="/"
+_QUOTE_SAFE_BYTES = (string.ascii_letters + string.digits + "_.-~/").encode("ascii")
+
+_TAG_ABSTRACT = f"{{{CEI_NS}}}abstract"
+_TAG_ARCH = f"{{{CEI_NS}}}arch"
+_TAG_ARCH_IDENTIFIER = f"{{{CEI_NS}}}archIdentifier"
+_TAG_AUTH = f"{{{CEI_NS}}}auth"
+_TAG_BACK = f"{{{CEI_NS}}}back"
+_TAG_BIBL = f"{{{CEI_NS}}}bibl"
+_TAG_BODY = f"{{{CEI_NS}}}body"
+_TAG_CH_DESC = f"{{{CEI_NS}}}chDesc"
+_TAG_CONDITION = f"{{{CEI_NS}}}condition"
+_TAG_DATE = f"{{{CEI_NS}}}date"
+_TAG_DATE_RANGE = f"{{{CEI_NS}}}dateRange"
+_TAG_DIMENSIONS = f"{{{CEI_NS}}}dimensions"
+_TAG_DIPLOMATIC_ANALYSIS = f"{{{CEI_NS}}}diplomaticAnalysis"
+_TAG_DIV_NOTES = f"{{{CEI_NS}}}divNotes"
+_TAG_FIGURE = f"{{{CEI_NS}}}figure"
+_TAG_FRONT = f"{{{CEI_NS}}}front"
+_TAG_GEOG_NAME = f"{{{CEI_NS}}}geogName"
+_TAG_GRAPHIC = f"{{{CEI_NS}}}graphic"
+_TAG_IDNO = f"{{{CEI_NS}}}idno"
+_TAG_INDEX = f"{{{CEI_NS}}}index"
+_TAG_ISSUED = f"{{{CEI_NS}}}issued"
+_TAG_ISSUER = f"{{{CEI_NS}}}issuer"
+_TAG_LANG_MOM = f"{{{CEI_NS}}}lang_MOM"
+_TAG_LIST_BIBL = f"{{{CEI_NS}}}listBibl"
+_TAG_LIST_BIBL_EDITION = f"{{{CEI_NS}}}listBiblEdition"
+_TAG_LIST_BIBL_ERW = f"{{{CEI_NS}}}listBiblErw"
+_TAG_LIST_BIBL_FAKSIMILE = f"{{{CEI_NS}}}listBiblFaksimile"
+_TAG_LIST_BIBL_REGEST = f"{{{CEI_NS}}}listBiblRegest"
+_TAG_MATERIAL = f"{{{CEI_NS}}}material"
+_TAG_NOTA = f"{{{CEI_NS}}}nota"
+_TAG_NOTARIUS_DESC = f"{{{CEI_NS}}}notariusDesc"
+_TAG_NOTE = f"{{{CEI_NS}}}note"
+_TAG_ORG_NAME = f"{{{CEI_NS}}}orgName"
+_TAG_P = f"{{{CEI_NS}}}p"
+_TAG_PERS_NAME = f"{{{CEI_NS}}}persName"
+_TAG_PHYSICAL_DESC = f"{{{CEI_NS}}}physicalDesc"
+_TAG_PLACE_NAME = f"{{{CEI_NS}}}placeName"
+_TAG_QUOTE_ORIGINALDATIERUNG = f"{{{CEI_NS}}}quoteOriginaldatierung"
+_TAG_RECIPIENT = f"{{{CEI_NS}}}recipient"
+_TAG_REF = f"{{{CEI_NS}}}ref"
+_TAG_SEAL = f"{{{CEI_NS}}}seal"
+_TAG_SEAL_DESC = f"{{{CEI_NS}}}sealDesc"
+_TAG_SOURCE_DESC = f"{{{CEI_NS}}}sourceDesc"
+_TAG_SOURCE_DESC_REGEST = f"{{{CEI_NS}}}sourceDescRegest"
+_TAG_SOURCE_DESC_VOLLTEXT = f"{{{CEI_NS}}}sourceDescVolltext"
+_TAG_TENOR = f"{{{CEI_NS}}}tenor"
+_TAG_TEXT = f"{{{CEI_NS}}}text"
+_TAG_TRADITIO_FORM = f"{{{CEI_NS}}}traditioForm"
+_TAG_WITNESS_ORIG = f"{{{CEI_NS}}}witnessOrig"
+_TEXT_TEMPLATE = etree.Element(_TAG_TEXT, type="charter", nsmap=CHARTER_NSS)
+etree.SubElement(_TEXT_TEMPLATE, _TAG_FRONT)
+etree.SubElement(_TEXT_TEMPLATE, _TAG_BODY)
+etree.SubElement(_TEXT_TEMPLATE, _TAG_BACK)
+
+# Charter slots that only hold values derived from the other slots
+_CACHE_SLOTS = frozenset(("_date_value_time", "_id_norm_quoted", "_xml"))
+
+Date = Union[str, datetime, "Time"]
 
 DateValue = Optional[Date | Tuple[Date, Date]]
 
 
-def to_mom_date_value(time: Time) -> str:
+def fast_quote(value: str) -> str:
+    """Percent-encodes a string like urllib.parse.quote but returns strings that don't need encoding without running the full quoting routine.
+
+    Args:
+        value (str): The string to encode.
+
+    Returns:
+        The percent-encoded string.
+    """
+    if value.isascii() and not value.encode("ascii").rstrip(_QUOTE_SAFE_BYTES):
+        return value
+    return quote(value)
+
+
+def _time_class() -> type:
+    # astropy.time is slow to import, so it is only loaded once a date actually needs it
+    from astropy.time import Time
+
+    return Time
+
+
+def _is_time(value: Any) -> bool:
+    # A value can only be an astropy.Time object if astropy.time has been imported
+    module = sys.modules.get("astropy.time")
+    return module is not None and isinstance(value, module.Time)
+
+
+class MomDate:
+    """A plain calendar date parsed from a mom-compatible or plain iso date string. It is used in place of an astropy.Time object, which is only created when one is actually requested, and can't be changed after creation. For iso input, the original string is kept so the astropy.Time object gets the isot format like when it is parsed directly."""
+
+    __slots__ = ("year", "month", "day", "iso")
+
+    def __init__(
+        self, year: int, month: int, day: int, iso: Optional[str] = None
+    ) -> None:
+        # Parsed dates are cached and shared, so they can't be changed after creation
+        object.__setattr__(self, "year", year)
+        object.__setattr__(self, "month", month)
+        object.__setattr__(self, "day", day)
+        object.__setattr__(self, "iso", iso)
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        raise AttributeError("MomDate objects can't be changed")
+
+    def __delattr__(self, name: str) -> None:
+        raise AttributeError("MomDate objects can't be changed")
+
+    def __reduce__(self) -> Tuple[type, Tuple[int, int, int, Optional[str]]]:
+        return (MomDate, (self.year, self.month, self.day, self.iso))
+
+    def __repr__(self) -> str:
+        return "MomDate({}, {}, {})".format(self.year, self.month, self.day)
+
+    def to_time(self) -> Time:
+        """Converts the date to an astropy.Time object.
+
+        Returns:
+            An astropy.Time object for the date.
+        """
+        if self.iso is not None:
+            return _time_class()(self.iso, format="isot", scale="ut1")
+        return _time_class()(
+            {"year": self.year, "month": self.month, "day": self.day},
+            format="ymdhms",
+            scale="ut1",
+        )
+
+
+def to_mom_date_value(time: Time | MomDate) -> str:
     """Converts an astropy.Time object to a mom-compatible date string.
 
     Args:
-        time (Time): An astropy.Time object
+        time (Time | MomDate): An astropy.Time object or a parsed mom date
 
     Returns:
         A date string compatible with mom-ca.
     """
-    year = time.ymdhms[0]
-    month = time.ymdhms[1]
-    day = time.ymdhms[2]
-    return "{year}{month}{day}".format(
-        year=str(year).zfill(3) if year >= 0 else "-" + str(year * -1).zfill(3),
-        month=str(month).zfill(2),
-        day=str(day).zfill(2),
-    )
+    if isinstance(time, MomDate):
+        year, month, day = time.year, time.month, time.day
+    else:
+        # ymdhms is recomputed on every access
+        ymdhms = time.ymdhms
+        year, month, day = ymdhms[0], ymdhms[1], ymdhms[2]
+    sign = "-" if year < 0 else ""
+    return f"{sign}{abs(year):03d}{month:02d}{day:02d}"
+
+
+def to_long_date(time: Time | MomDate) -> str:
+    """Formats a date like the astropy fits longdate format, for instance '+01307-02-22'.
+
+    Args:
+        time (Time | MomDate): An astropy.Time object or a parsed mom date
+
+    Returns:
+        The date as a signed, five digit year long date string.
+    """
+    if isinstance(time, MomDate):
+        return f"{time.year:+06d}-{time.month:02d}-{time.day:02d}"
+    return time.to_value("fits", subfmt="longdate")
+
+
+def parse_mom_date(value: str) -> MomDate | Tuple[MomDate, MomDate]:
+    """Parses a mom-compatible date string without creating astropy.Time objects.
+
+    Args:
+        value (str): A mom-compatible date string in the form of -?[129]?[0-9][0-9][0-9][019][0-9][01239][0-9]
+
+    Returns:
+        A single date or, for "99" months or days, a tuple with the first and the last day of the year or month.
+
+    Raises:
+        ValueError: If the provided value is not a valid date
+    """
+    # Fixed width layout, checked the same way as MOM_DATE_REGEX
+    digits = value[1:] if value[:1] == "-" else value
+    if (
+        not 7 <= len(digits) <= 8
+        or not digits.isascii()
+        or not digits.isdigit()
+        or (len(digits) == 8 and digits[0] not in "129")
+        or digits[-4] not in "019"
+        or digits[-2] not in "01239"
+    ):
+        raise ValueError("Invalid mom date value provided: '{}'".format(value))
+    year = int(value[:-4])
+    month = value[-4:-2]
+    day = value[-2:]
+    if year < _MIN_YEAR:
+        raise ValueError("Invalid year in mom date value: {}".format(year))
+    if month == "99":
+        return (MomDate(year, 1, 1), MomDate(year, 12, 31))
+    if not 1 <= int(month) <= 12:
+        raise ValueError("Invalid month in mom date value: {}".format(month))
+    days = calendar.monthrange(year, int(month))[1]
+    if day == "99":
+        return (MomDate(year, int(month), 1), MomDate(year, int(month), days))
+    if not 1 <= int(day) <= days:
+        raise ValueError("Invalid day in mom date value: {}".format(day))
+    return MomDate(year, int(month), int(day))
 
 
 def mom_date_to_time(value: str) -> Time | Tuple[Time, Time]:
@@ -59,57 +252,25 @@ def mom_date_to_time(value: str) -> Time | Tuple[Time, Time]:
         ValueError: If the provided value cannot be converted to a valid astropy.Time object
 
     """
-    match = re.search(MOM_DATE_REGEX, value)
-    if match is None:
-        raise ValueError("Invalid mom date value provided: '{}'".format(value))
-    year = match.group("year")
-    if not isinstance(year, str):
-        raise ValueError("Invalid year in mom date value: {}".format(year))
-    month = match.group("month")
-    if not isinstance(month, str):
-        raise ValueError("Invalid month in mom date value: {}".format(month))
-    day = match.group("day")
-    if not isinstance(day, str):
-        raise ValueError("Invalid day in mom date value: {}".format(day))
-    if month == "99":
-        return (
-            Time(
-                {"year": int(year), "month": 1, "day": 1},
-                format="ymdhms",
-                scale="ut1",
-            ),
-            Time(
-                {
-                    "year": int(year),
-                    "month": 12,
-                    "day": 31,
-                },
-                format="ymdhms",
-                scale="ut1",
-            ),
-        )
-    if day == "99":
-        return (
-            Time(
-                {"year": int(year), "month": int(month), "day": 1},
-                format="ymdhms",
-                scale="ut1",
-            ),
-            Time(
-                {
-                    "year": int(year),
-                    "month": int(month),
-                    "day": calendar.monthrange(int(year), int(month))[1],
-                },
-                format="ymdhms",
-                scale="ut1",
-            ),
-        )
-    return Time(
-        {"year": int(year), "month": int(month), "day": int(day)},
-        format="ymdhms",
-        scale="ut1",
-    )
+    return to_time(parse_mom_date(value))  # type: ignore
+
+
+def to_time(
+    value: Optional[Time | MomDate | Tuple[Time | MomDate, Time | MomDate]]
+) -> Optional[Time | Tuple[Time, Time]]:
+    """Converts parsed mom dates in a single or tuple date value to astropy.Time objects.
+
+    Args:
+        value: A single or tuple date value, astropy.Time objects are returned as they are.
+
+    Returns:
+        The single or tuple astropy.Time object or None if no value was given.
+    """
+    if isinstance(value, MomDate):
+        return value.to_time()
+    if isinstance(value, tuple):
+        return (to_time(value[0]), to_time(value[1]))  # type: ignore
+    return value
 
 
 def extract_time(time: Time | Tuple[Time, Time]) -> Time:
@@ -120,12 +281,86 @@ def extract_time(time: Time | Tuple[Time, Time]) -> Time:
     Returns:
         The first date if a tuple is provided, the date if a date is provided.
     """
-    if isinstance(time, Tuple):
+    if isinstance(time, tuple):
         return time[0]
     else:
         return time
 
 
+def _is_iso_date_string(value: str) -> bool:
+    # Mom date strings only consist of digits and can never be valid iso dates
+    return (
+        bool(value)
+        and value != NO_DATE_VALUE
+        and not (value[1:] if value[:1] == "-" else value).isdigit()
+    )
+
+
+def _is_plain_iso_date_string(value: str) -> bool:
+    # Iso dates without a time of day, for instance "1307-02-22"
+    return len(value) == 10 and value[4] == "-" and value[7] == "-"
+
+
+def _needs_time_class(value: str) -> bool:
+    return _is_iso_date_string(value) and not _is_plain_iso_date_string(value)
+
+
+def _parse_date_string(value: str) -> Time | MomDate | Tuple[MomDate, MomDate]:
+    date = _parse_cached_date_string(value)
+    # astropy.Time objects are mutable, so every caller gets its own copy
+    return date.copy() if _is_time(date) else date  # type: ignore
+
+
+@lru_cache(maxsize=4096)
+def _parse_cached_date_string(
+    value: str,
+) -> Time | MomDate | Tuple[MomDate, MomDate]:
+    if not _is_iso_date_string(value):
+        return parse_mom_date(value)
+    # Plain iso dates without a time of day don't need astropy either
+    if _is_plain_iso_date_string(value):
+        try:
+            day = datetime.fromisoformat(value)
+        except ValueError:
+            # Out of the range of python dates, left to astropy
+            pass
+        else:
+            return MomDate(day.year, day.month, day.day, value)
+    try:
+        return _time_class()(value, format="isot", scale="ut1")
+    except ValueError:
+        raise ValueError("Invalid mom date value provided: '{}'".format(value))
+
+
+def string_to_date(
+    value: str | Tuple[str, str]
+) -> Time | MomDate | Tuple[Time | MomDate, Time | MomDate]:
+    """Converts a single date string or a tuple of date strings to a matching single or tuple date. Mom-compatible strings are parsed into MomDate objects, iso strings into astropy.Time objects.
+
+    Args:
+        value (str | Tuple[str, str]): A single or tuple of date strings. Can be either an iso-compatible or a mom-ca compatible date string.
+
+    Returns:
+        A single or tuple date.
+
+    Raises:
+        ValueError: If the date/s cannot be converted.
+    """
+    if isinstance(value, str):
+        return _parse_date_string(value)
+    if len(value) != 2:
+        raise ValueError("Invalid date tuple provided: '{}'".format(value))
+    try:
+        start = _parse_date_string(value[0])
+        end = _parse_date_string(value[1])
+    except ValueError:
+        raise ValueError("Failed to transform mom string to Time: '{}'".format(value))
+    # Iso and mom date strings cannot be mixed in a single date range
+    if _is_iso_date_string(value[0]) != _is_iso_date_string(value[1]):
+        raise ValueError("Failed to transform mom string to Time: '{}'".format(value))
+    return (extract_time(start), extract_time(end))  # type: ignore
+
+
 def string_to_time(value: str | Tuple[str, str]) -> Time | Tuple[Time, Time]:
     """Converts a single date string or a tuple of date strings to a matching single or tuple astropy.Time object.
 
@@ -138,115 +373,136 @@ def string_to_time(value: str | Tuple[str, str]) -> Time | Tuple[Time, Time]:
     Raises:
         ValueError: If the date/s cannot be converted to astropy.Time objects.
     """
-    if isinstance(value, Tuple) and len(value) != 2:
-        raise ValueError("Invalid date tuple provided: '{}'".format(value))
-    try:
-        # Try to directly convert from an iso date string
-        return (
-            Time(value, format="isot", scale="ut1")
-            if isinstance(value, str)
-            else (
-                Time(value[0], format="isot", scale="ut1"),
-                Time(value[1], format="isot", scale="ut1"),
-            )
-        )
-    # Direct conversion not possible, try to convert mom date strings
-    except Exception:
-        if isinstance(value, Tuple):
-            try:
-                return (
-                    extract_time(mom_date_to_time(value[0])),
-                    extract_time(mom_date_to_time(value[1])),
-                )
-            except Exception:
-                raise ValueError(
-                    "Failed to transform mom string to Time: '{}'".format(value)
-                )
-        else:
-            return mom_date_to_time(value)
+    return to_time(string_to_date(value))  # type: ignore
 
 
 class Charter(XmlAssembler):
-    _abstract: Optional[str | etree._Element] = None
-    _abstract_sources: List[str] = []
-    _archive: Optional[str] = None
-    _chancellary_remarks: List[str] = []
-    _comments: List[str] = []
-    _condition: Optional[str] = None
-    _date: Optional[str | etree._Element] = None
-    _date_quote: Optional[str | etree._Element] = None
-    _date_value: Optional[Time | Tuple[Time, Time]] = None
-    _dimensions: Optional[str] = None
-    _external_link: Optional[str] = None
-    _footnotes: List[str] = []
-    _graphic_urls: List[str] = []
-    _id_norm: Optional[str] = None
-    _id_old: Optional[str] = None
-    _id_text: str = ""
-    _index: List[str | etree._Element] = []
-    _index_geo_features: List[str | etree._Element] = []
-    _index_organizations: List[str | etree._Element] = []
-    _index_persons: List[str | etree._Element] = []
-    _index_places: List[str | etree._Element] = []
-    _issued_place: Optional[str | etree._Element] = None
-    _issuers: Optional[str | etree._Element | List[str] | List[etree._Element]] = None
-    _language: Optional[str] = None
-    _literature: List[str] = []
-    _literature_abstracts: List[str] = []
-    _literature_depictions: List[str] = []
-    _literature_editions: List[str] = []
-    _literature_secondary: List[str] = []
-    _material: Optional[str] = None
-    _notarial_authentication: Optional[str | etree._Element] = None
-    _recipient: Optional[str | etree._Element] = None
-    _seals: Optional[etree._Element | str | Seal | List[str] | List[Seal]] = None
-    _tradition: Optional[str] = None
-    _transcription: Optional[str | etree._Element] = None
-    _transcription_sources: List[str] = []
-    _witnesses: List[str | etree._Element] = []
+    __slots__ = (
+        "_abstract",
+        "_abstract_sources",
+        "_archive",
+        "_chancellary_remarks",
+        "_comments",
+        "_condition",
+        "_date",
+        "_date_quote",
+        "_date_value",
+        "_date_value_time",
+        "_dimensions",
+        "_external_link",
+        "_footnotes",
+        "_graphic_urls",
+        "_id_norm",
+        "_id_norm_quoted",
+        "_id_old",
+        "_id_text",
+        "_index",
+        "_index_geo_features",
+        "_index_organizations",
+        "_index_persons",
+        "_index_places",
+        "_issued_place",
+        "_issuers",
+        "_language",
+        "_literature",
+        "_literature_abstracts",
+        "_literature_depictions",
+        "_literature_editions",
+        "_literature_secondary",
+        "_material",
+        "_notarial_authentication",
+        "_recipient",
+        "_seals",
+        "_tradition",
+        "_transcription",
+        "_transcription_sources",
+        "_witnesses",
+        "_xml",
+    )
+
+    _abstract: Optional[str | etree._Element]
+    _abstract_sources: Tuple[str, ...]
+    _archive: Optional[str]
+    _chancellary_remarks: Tuple[str, ...]
+    _comments: Tuple[str, ...]
+    _condition: Optional[str]
+    _date: Optional[str | etree._Element]
+    _date_quote: Optional[str | etree._Element]
+    _date_value: Optional[Time | MomDate | Tuple[Time | MomDate, Time | MomDate]]
+    _date_value_time: Optional[Time | Tuple[Time, Time]]
+    _dimensions: Optional[str]
+    _external_link: Optional[str]
+    _footnotes: Tuple[str, ...]
+    _graphic_urls: Tuple[str, ...]
+    _id_norm: Optional[str]
+    _id_norm_quoted: Optional[str]
+    _id_old: Optional[str]
+    _id_text: str
+    _index: Tuple[str | etree._Element, ...]
+    _index_geo_features: Tuple[str | etree._Element, ...]
+    _index_organizations: Tuple[str | etree._Element, ...]
+    _index_persons: Tuple[str | etree._Element, ...]
+    _index_places: Tuple[str | etree._Element, ...]
+    _issued_place: Optional[str | etree._Element]
+    _issuers: Optional[str | etree._Element | Tuple[str | etree._Element, ...]]
+    _language: Optional[str]
+    _literature: Tuple[str, ...]
+    _literature_abstracts: Tuple[str, ...]
+    _literature_depictions: Tuple[str, ...]
+    _literature_editions: Tuple[str, ...]
+    _literature_secondary: Tuple[str, ...]
+    _material: Optional[str]
+    _notarial_authentication: Optional[str | etree._Element]
+    _recipient: Optional[str | etree._Element]
+    _seals: Optional[etree._Element | str | Seal | Tuple[str | Seal, ...]]
+    _tradition: Optional[str]
+    _transcription: Optional[str | etree._Element]
+    _transcription_sources: Tuple[str, ...]
+    _witnesses: Tuple[str | etree._Element, ...]
+    _xml: Optional[etree._Element]
 
     def __init__(
         self,
         id_text: str,
         abstract: Optional[str | etree._Element] = None,
-        abstract_sources: Optional[str | List[str]] = [],
+        abstract_sources: Optional[str | List[str]] = None,
         archive: Optional[str] = None,
-        chancellary_remarks: Optional[str | List[str]] = [],
-        comments: Optional[str | List[str]] = [],
+        chancellary_remarks: Optional[str | List[str]] = None,
+        comments: Optional[str | List[str]] = None,
         condition: Optional[str] = None,
         date: Optional[str | etree._Element] = None,
         date_quote: Optional[str | etree._Element] = None,
         date_value: Optional[DateValue] = None,
         dimensions: Optional[str] = None,
         external_link: Optional[str] = None,
-        footnotes: Optional[str | List[str]] = [],
-        graphic_urls: Optional[str | List[str]] = [],
+        footnotes: Optional[str | List[str]] = None,
+        graphic_urls: Optional[str | List[str]] = None,
         id_norm: Optional[str] = None,
         id_old: Optional[str] = None,
-        index: Optional[List[str | etree._Element]] = [],
-        index_geo_features: Optional[List[str | etree._Element]] = [],
-        index_organizations: Optional[List[str | etree._Element]] = [],
-        index_persons: Optional[List[str | etree._Element]] = [],
-        index_places: Optional[List[str | etree._Element]] = [],
+        index: Optional[List[str | etree._Element]] = None,
+        index_geo_features: Optional[List[str | etree._Element]] = None,
+        index_organizations: Optional[List[str | etree._Element]] = None,
+        index_persons: Optional[List[str | etree._Element]] = None,
+        index_places: Optional[List[str | etree._Element]] = None,
         issued_place: Optional[str | etree._Element] = None,
         issuer: Optional[str | etree._Element] = None,
         issuers: Optional[
             str | etree._Element | List[str] | List[etree._Element]
         ] = None,
         language: Optional[str] = None,
-        literature: Optional[str | List[str]] = [],
-        literature_abstracts: Optional[str | List[str]] = [],
-        literature_depictions: Optional[str | List[str]] = [],
-        literature_editions: Optional[str | List[str]] = [],
-        literature_secondary: Optional[str | List[str]] = [],
+        literature: Optional[str | List[str]] = None,
+        literature_abstracts: Optional[str | List[str]] = None,
+        literature_depictions: Optional[str | List[str]] = None,
+        literature_editions: Optional[str | List[str]] = None,
+        literature_secondary: Optional[str | List[str]] = None,
         material: Optional[str] = None,
         notarial_authentication: Optional[str | etree._Element] = None,
         recipient: Optional[str | etree._Element] = None,
         seals: Optional[etree._Element | str | Seal | List[str] | List[Seal]] = None,
         tradition: Optional[str] = None,
         transcription: Optional[str | etree._Element] = None,
-        transcription_sources: Optional[str] | List[str] = [],
-        witnesses: Optional[List[str | etree._Element]] = [],
+        transcription_sources: Optional[str | List[str]] = None,
+        witnesses: Optional[List[str | etree._Element]] = None,
     ) -> None:
         """
         Creates a new charter object. Empty strings in the parameters are treated similar to None values.
@@ -296,49 +552,131 @@ class Charter(XmlAssembler):
         """
         if not id_text:
             raise ValueError("id_text is not allowed to be empty")
-        self.abstract = abstract
-        self.abstract_sources = abstract_sources
-        self.archive = archive
-        self.chancellary_remarks = chancellary_remarks
-        self.comments = comments
-        self.condition = condition
-        self.date = date
-        self.date_quote = date_quote
+        # Slots have no class-level defaults, so the caches and all fields are
+        # initialized first and the setters only run for values that were given
+        self._clear_cache()
+        self._abstract = None
+        self._abstract_sources = ()
+        self._archive = None
+        self._chancellary_remarks = ()
+        self._comments = ()
+        self._condition = None
+        self._date = None
+        self._date_quote = None
+        self._date_value = None
+        self._dimensions = None
+        self._external_link = None
+        self._footnotes = ()
+        self._graphic_urls = ()
+        self._id_norm = None
+        self._id_old = None
+        self._index = ()
+        self._index_geo_features = ()
+        self._index_organizations = ()
+        self._index_persons = ()
+        self._index_places = ()
+        self._issued_place = None
+        self._issuers = None
+        self._language = None
+        self._literature = ()
+        self._literature_abstracts = ()
+        self._literature_depictions = ()
+        self._literature_editions = ()
+        self._literature_secondary = ()
+        self._material = None
+        self._notarial_authentication = None
+        self._recipient = None
+        self._seals = None
+        self._tradition = None
+        self._transcription = None
+        self._transcription_sources = ()
+        self._witnesses = ()
+        if abstract is not None:
+            self.abstract = abstract
+        if abstract_sources is not None:
+            self.abstract_sources = abstract_sources
+        if archive is not None:
+            self.archive = archive
+        if chancellary_remarks is not None:
+            self.chancellary_remarks = chancellary_remarks
+        if comments is not None:
+            self.comments = comments
+        if condition is not None:
+            self.condition = condition
+        if date is not None:
+            self.date = date
+        if date_quote is not None:
+            self.date_quote = date_quote
         if date_value is not None:
             self.date_value = date_value
-        self.dimensions = dimensions
-        self.external_link = external_link
-        self.footnotes = footnotes
-        self.graphic_urls = graphic_urls
-        self.id_norm = id_norm
-        self.id_old = id_old
+        if dimensions is not None:
+            self.dimensions = dimensions
+        if external_link is not None:
+            self.external_link = external_link
+        if footnotes is not None:
+            self.footnotes = footnotes
+        if graphic_urls is not None:
+            self.graphic_urls = graphic_urls
+        if id_norm is not None:
+            self.id_norm = id_norm
+        if id_old is not None:
+            self.id_old = id_old
         self.id_text = id_text
-        self.index = index
-        self.index_geo_features = index_geo_features
-        self.index_organizations = index_organizations
-        self.index_persons = index_persons
-        self.index_places = index_places
-        self.issued_place = issued_place
-        self.issuers = issuers
+        if index is not None:
+            self.index = index
+        if index_geo_features is not None:
+            self.index_geo_features = index_geo_features
+        if index_organizations is not None:
+            self.index_organizations = index_organizations
+        if index_persons is not None:
+            self.index_persons = index_persons
+        if index_places is not None:
+            self.index_places = index_places
+        if issued_place is not None:
+            self.issued_place = issued_place
+        if issuers is not None:
+            self.issuers = issuers
         if issuer is not None:
             warnings.warn(
                 "The 'issuer' parameter is deprecated in favor of 'issuers' which can take the same value but supports multiple issuers. Setting issuer will erase values set with issuers for legacy support reasons."
             )
             self.issuers = issuer
-        self.language = language
-        self.literature = literature
-        self.literature_abstracts = literature_abstracts
-        self.literature_depictions = literature_depictions
-        self.literature_editions = literature_editions
-        self.literature_secondary = literature_secondary
-        self.material = material
-        self.notarial_authentication = notarial_authentication
-        self.recipient = recipient
-        self.seals = seals
-        self.tradition = tradition
-        self.transcription = transcription
-        self.transcription_sources = transcription_sources
-        self.witnesses = witnesses
+        if language is not None:
+            self.language = language
+        if literature is not None:
+            self.literature = literature
+        if literature_abstracts is not None:
+            self.literature_abstracts = literature_abstracts
+        if literature_depictions is not None:
+            self.literature_depictions = literature_depictions
+        if literature_editions is not None:
+            self.literature_editions = literature_editions
+        if literature_secondary is not None:
+            self.literature_secondary = literature_secondary
+        if material is not None:
+            self.material = material
+        if notarial_authentication is not None:
+            self.notarial_authentication = notarial_authentication
+        if recipient is not None:
+            self.recipient = recipient
+        if seals is not None:
+            self.seals = seals
+        if tradition is not None:
+            self.tradition = tradition
+        if transcription is not None:
+            self.transcription = transcription
+        if transcription_sources is not None:
+            self.transcription_sources = transcription_sources
+        if witnesses is not None:
+            self.witnesses = witnesses
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        # Setting a public property drops the cached xml. Private fields are only
+        # written by the properties themselves and by the caches. Lists are stored
+        # as tuples so they can't change in place, elements and seals can, see to_xml.
+        if name[0] != "_" and self._has_cache():
+            self._clear_cache()
+        object.__setattr__(self, name, value)
 
     # --------------------------------------------------------------------#
     #                             Properties                             #
@@ -361,8 +699,8 @@ class Charter(XmlAssembler):
         return self._abstract_sources
 
     @abstract_sources.setter
-    def abstract_sources(self, value: Optional[str | List[str]] = []):
-        self._abstract_sources = get_str_list(value)
+    def abstract_sources(self, value: Optional[str | List[str]] = None):
+        self._abstract_sources = tuple(get_str_list(value))
 
     @property
     def archive(self):
@@ -377,16 +715,16 @@ class Charter(XmlAssembler):
         return self._chancellary_remarks
 
     @chancellary_remarks.setter
-    def chancellary_remarks(self, value: Optional[str | List[str]] = []):
-        self._chancellary_remarks = get_str_list(value)
+    def chancellary_remarks(self, value: Optional[str | List[str]] = None):
+        self._chancellary_remarks = tuple(get_str_list(value))
 
     @property
     def comments(self):
         return self._comments
 
     @comments.setter
-    def comments(self, value: Optional[str | List[str]] = []):
-        self._comments = get_str_list(value)
+    def comments(self, value: Optional[str | List[str]] = None):
+        self._comments = tuple(get_str_list(value))
 
     @property
     def condition(self):
@@ -414,62 +752,50 @@ class Charter(XmlAssembler):
 
     @property
     def date_value(self):
-        return self._date_value
+        # Dates parsed from mom strings are only converted to astropy.Time on request
+        if self._date_value_time is None:
+            self._date_value_time = to_time(self._date_value)
+        return self._date_value_time
 
     @date_value.setter
     def date_value(self, value: Optional[DateValue] = None):
         # Don't allow to directly set date values if an XML date element is present
-        if isinstance(self.date, etree._Element):
+        if isinstance(self._date, etree._Element):
             raise ValueError(
                 "Not allowed to set date value directly if the date is already an XML element."
             )
-        # Unknown MOM date (99999999)
-        elif (
-            isinstance(value, str) and (value == NO_DATE_VALUE or not len(value))
-        ) or (
-            isinstance(value, Tuple)
-            and len(value) == 2
-            and value[0] == NO_DATE_VALUE
-            and value[1] == NO_DATE_VALUE
-        ):
+        elif value is None:
             self._date_value = None
-        # Directly set None, Time and [Time, Time] values
-        elif (
-            value is None
-            or isinstance(value, Time)
-            or (
-                isinstance(value, Tuple)
-                and len(value) == 2
-                and isinstance(value[0], Time)
-                and isinstance(value[1], Time)
+        # Convert strings, empty strings and 99999999 are unknown MOM dates
+        elif isinstance(value, str):
+            self._date_value = (
+                None
+                if value == NO_DATE_VALUE or not len(value)
+                else string_to_date(value)
             )
-        ):
+        # Date ranges
+        elif isinstance(value, tuple) and len(value) == 2:
+            start, end = value
+            if isinstance(start, str) and isinstance(end, str):
+                # Unknown MOM date (99999999)
+                self._date_value = (
+                    None
+                    if start == NO_DATE_VALUE and end == NO_DATE_VALUE
+                    else string_to_date(value)
+                )
+            elif _is_time(start) and _is_time(end):
+                self._date_value = value
+            elif isinstance(start, datetime) and isinstance(end, datetime):
+                time = _time_class()
+                self._date_value = (time(start, scale="ut1"), time(end, scale="ut1"))
+            else:
+                raise ValueError("Invalid date value: '{}'".format(value))
+        # Directly set Time values
+        elif _is_time(value):
             self._date_value = value  # type: ignore
         # Convert python date objects
         elif isinstance(value, datetime):
-            self._date_value = Time(value, scale="ut1")
-        # Convert python date tuples
-        elif (
-            isinstance(value, Tuple)
-            and len(value) == 2
-            and isinstance(value[0], datetime)
-            and isinstance(value[1], datetime)
-        ):
-            self._date_value = (
-                Time(value[0], scale="ut1"),
-                Time(value[1], scale="ut1"),
-            )
-        # Convert strings
-        elif isinstance(value, str):
-            self._date_value = string_to_time(value)
-        # Convert string tuples
-        elif (
-            isinstance(value, Tuple)
-            and len(value) == 2
-            and isinstance(value[0], str)
-            and isinstance(value[1], str)
-        ):
-            self._date_value = string_to_time(value)  # type: ignore
+            self._date_value = _time_class()(value, scale="ut1")
         else:
             raise ValueError("Invalid date value: '{}'".format(value))
 
@@ -489,7 +815,7 @@ class Charter(XmlAssembler):
     def external_link(self, value: Optional[str] = None):
         if not isinstance(value, str) or len(value) == 0:
             return None
-        if not re.match(SIMPLE_URL_REGEX, value):
+        if not SIMPLE_URL_REGEX.match(value):
             raise ValueError(
                 "'{}' does not look like a valid external URL. If you think it is valid, please contact the to-CEI library maintainers and tell them.".format(
                     value
@@ -502,20 +828,24 @@ class Charter(XmlAssembler):
         return self._footnotes
 
     @footnotes.setter
-    def footnotes(self, value: Optional[str | List[str]] = []):
-        self._footnotes = get_str_list(value)
+    def footnotes(self, value: Optional[str | List[str]] = None):
+        self._footnotes = tuple(get_str_list(value))
 
     @property
     def graphic_urls(self):
         return self._graphic_urls
 
     @graphic_urls.setter
-    def graphic_urls(self, value: Optional[str | List[str]] = []):
-        self._graphic_urls = get_str_list(value)
+    def graphic_urls(self, value: Optional[str | List[str]] = None):
+        self._graphic_urls = tuple(get_str_list(value))
 
     @property
     def id_norm(self):
-        return quote(self._id_norm if self._id_norm else self.id_text)
+        if self._id_norm_quoted is None:
+            self._id_norm_quoted = fast_quote(
+                self._id_norm if self._id_norm else self.id_text
+            )
+        return self._id_norm_quoted
 
     @id_norm.setter
     def id_norm(self, value: Optional[str] = None):
@@ -542,40 +872,40 @@ class Charter(XmlAssembler):
         return self._index
 
     @index.setter
-    def index(self, value: Optional[List[str | etree._Element]] = []):
-        self._index = get_str_or_element_list(value, "index")
+    def index(self, value: Optional[List[str | etree._Element]] = None):
+        self._index = tuple(get_str_or_element_list(value, "index"))
 
     @property
     def index_geo_features(self):
         return self._index_geo_features
 
     @index_geo_features.setter
-    def index_geo_features(self, value: Optional[List[str | etree._Element]] = []):
-        self._index_geo_features = get_str_or_element_list(value, "geogName")
+    def index_geo_features(self, value: Optional[List[str | etree._Element]] = None):
+        self._index_geo_features = tuple(get_str_or_element_list(value, "geogName"))
 
     @property
     def index_organizations(self):
         return self._index_organizations
 
     @index_organizations.setter
-    def index_organizations(self, value: Optional[List[str | etree._Element]] = []):
-        self._index_organizations = get_str_or_element_list(value, "orgName")
+    def index_organizations(self, value: Optional[List[str | etree._Element]] = None):
+        self._index_organizations = tuple(get_str_or_element_list(value, "orgName"))
 
     @property
     def index_persons(self):
         return self._index_persons
 
     @index_persons.setter
-    def index_persons(self, value: Optional[List[str | etree._Element]] = []):
-        self._index_persons = get_str_or_element_list(value, "persName")
+    def index_persons(self, value: Optional[List[str | etree._Element]] = None):
+        self._index_persons = tuple(get_str_or_element_list(value, "persName"))
 
     @property
     def index_places(self):
         return self._index_places
 
     @index_places.setter
-    def index_places(self, value: Optional[List[str | etree._Element]] = []):
-        self._index_places = get_str_or_element_list(value, "placeName")
+    def index_places(self, value: Optional[List[str | etree._Element]] = None):
+        self._index_places = tuple(get_str_or_element_list(value, "placeName"))
 
     @property
     def issued_place(self):
@@ -602,9 +932,10 @@ class Charter(XmlAssembler):
             )
         elif isinstance(value, etree._Element):
             get_str_or_element(value, "issuer")
-        elif isinstance(value, List):
+        elif isinstance(value, list):
             for item in value:
                 get_str_or_element(item, "issuer")
+            value = tuple(value)  # type: ignore
         self._issuers = value
 
     @property
@@ -620,40 +951,40 @@ class Charter(XmlAssembler):
         return self._literature
 
     @literature.setter
-    def literature(self, value: Optional[str | List[str]] = []):
-        self._literature = get_str_list(value)
+    def literature(self, value: Optional[str | List[str]] = None):
+        self._literature = tuple(get_str_list(value))
 
     @property
     def literature_abstracts(self):
         return self._literature_abstracts
 
     @literature_abstracts.setter
-    def literature_abstracts(self, value: Optional[str | List[str]] = []):
-        self._literature_abstracts = get_str_list(value)
+    def literature_abstracts(self, value: Optional[str | List[str]] = None):
+        self._literature_abstracts = tuple(get_str_list(value))
 
     @property
     def literature_depictions(self):
         return self._literature_depictions
 
     @literature_depictions.setter
-    def literature_depictions(self, value: Optional[str | List[str]] = []):
-        self._literature_depictions = get_str_list(value)
+    def literature_depictions(self, value: Optional[str | List[str]] = None):
+        self._literature_depictions = tuple(get_str_list(value))
 
     @property
     def literature_editions(self):
         return self._literature_editions
 
     @literature_editions.setter
-    def literature_editions(self, value: Optional[str | List[str]] = []):
-        self._literature_editions = get_str_list(value)
+    def literature_editions(self, value: Optional[str | List[str]] = None):
+        self._literature_editions = tuple(get_str_list(value))
 
     @property
     def literature_secondary(self):
         return self._literature_secondary
 
     @literature_secondary.setter
-    def literature_secondary(self, value: Optional[str | List[str]] = []):
-        self._literature_secondary = get_str_list(value)
+    def literature_secondary(self, value: Optional[str | List[str]] = None):
+        self._literature_secondary = tuple(get_str_list(value))
 
     @property
     def material(self):
@@ -694,6 +1025,8 @@ class Charter(XmlAssembler):
     ):
         if value is None or isinstance(value, str) and len(value) == 0:
             return None
+        if isinstance(value, list):
+            value = tuple(value)  # type: ignore
         validated = (
             get_str_or_element(value, "sealDesc")
             if isinstance(value, etree._Element)
@@ -725,360 +1058,412 @@ class Charter(XmlAssembler):
         return self._transcription_sources
 
     @transcription_sources.setter
-    def transcription_sources(self, value: Optional[str | List[str]] = []):
-        self._transcription_sources = get_str_list(value)
+    def transcription_sources(self, value: Optional[str | List[str]] = None):
+        self._transcription_sources = tuple(get_str_list(value))
 
     @property
     def witnesses(self):
         return self._witnesses
 
     @witnesses.setter
-    def witnesses(self, value: Optional[List[str | etree._Element]] = []):
-        self._witnesses = get_str_or_element_list(value, "persName")
+    def witnesses(self, value: Optional[List[str | etree._Element]] = None):
+        self._witnesses = tuple(get_str_or_element_list(value, "persName"))
 
     # --------------------------------------------------------------------#
     #                        Private CEI creators                        #
     # --------------------------------------------------------------------#
 
-    def _create_cei_abstract(self) -> Optional[etree._Element]:
-        children = join(self._create_cei_recipient(), *self._create_cei_issuers())
-        return (
-            CEI.abstract(self.abstract, *children)
-            if isinstance(self.abstract, str)
-            else self.abstract
-        )
-
-    def _create_cei_arch(self) -> Optional[etree._Element]:
-        return None if not self.archive else CEI.arch(self.archive)
-
-    def _create_cei_arch_identifier(self) -> Optional[etree._Element]:
-        children = join(self._create_cei_arch(), self._create_cei_ref())
-        return CEI.archIdentifier(*children) if len(children) else None
-
-    def _create_cei_auth(self) -> Optional[etree._Element]:
-        children = join(self._create_cei_notarius_desc(), self._create_cei_seal_desc())
-        return CEI.auth(*children) if len(children) else None
-
-    def _create_cei_back(self) -> etree._Element:
-        children = join(
-            [self._create_cei_pers_name(person, type="Zeuge") for person in self.witnesses],  # type: ignore
-            [self._create_cei_pers_name(person) for person in self.index_persons],  # type: ignore
-            [self._create_cei_org_name(organization) for organization in self.index_organizations],  # type: ignore
-            [self._create_cei_place_name(place) for place in self.index_places],  # type: ignore
-            [self._create_cei_geog_name(geo_feature) for geo_feature in self.index_geo_features],  # type: ignore
-            [self._create_cei_index(term) for term in self.index],  # type: ignore
-            self._create_cei_div_notes(),
-        )
-        return CEI.back(*children)
-
-    def _create_cei_bibls(self, bibls: List[str]) -> List[etree._Element]:
-        return [CEI.bibl(bibl) for bibl in bibls]
-
-    def _create_cei_body(self) -> etree._Element:
-        children = join(
-            self._create_cei_idno(), self._create_cei_chdesc(), self._create_cei_tenor()
-        )
-        return CEI.body(*children)
-
-    def _create_cei_chdesc(self) -> Optional[etree._Element]:
-        children = join(
-            self._create_cei_abstract(),
-            self._create_cei_issued(),
-            self._create_cei_witness_orig(),
-            self._create_cei_diplomatic_analysis(),
-            self._create_cei_lang_mom(),
+    def _create_cei_abstract(self, chdesc: etree._Element) -> Optional[etree._Element]:
+        if not isinstance(self._abstract, str):
+            return self._append_copy(chdesc, self._abstract)
+        abstract = etree.SubElement(chdesc, _TAG_ABSTRACT)
+        abstract.text = self._abstract
+        self._create_str_or_element(abstract, _TAG_RECIPIENT, self._recipient)
+        self._create_cei_issuers(abstract)
+        return abstract
+
+    def _create_cei_arch_identifier(
+        self, witness_orig: etree._Element
+    ) -> Optional[etree._Element]:
+        if not self._archive and self._external_link is None:
+            return None
+        arch_identifier = etree.SubElement(witness_orig, _TAG_ARCH_IDENTIFIER)
+        if self._archive:
+            etree.SubElement(arch_identifier, _TAG_ARCH).text = self._archive
+        if self._external_link is not None:
+            etree.SubElement(arch_identifier, _TAG_REF, target=self._external_link)
+        return arch_identifier
+
+    def _create_cei_auth(
+        self, witness_orig: etree._Element
+    ) -> Optional[etree._Element]:
+        if self._notarial_authentication is None and self._seals is None:
+            return None
+        auth = etree.SubElement(witness_orig, _TAG_AUTH)
+        self._create_str_or_element(
+            auth, _TAG_NOTARIUS_DESC, self._notarial_authentication
         )
-        return CEI.chDesc(*children) if len(children) else None
-
-    def _create_cei_condition(self) -> Optional[etree._Element]:
-        return None if self.condition is None else CEI.condition(self.condition)
-
-    def _create_cei_date(self) -> etree._Element:
+        self._create_cei_seal_desc(auth)
+        return auth
+
+    def _create_cei_bibls(
+        self, parent: etree._Element, tag: str, bibls: Tuple[str, ...]
+    ) -> etree._Element:
+        element = etree.SubElement(parent, tag)
+        for bibl in bibls:
+            etree.SubElement(element, _TAG_BIBL).text = bibl
+        return element
+
+    def _create_cei_chdesc(self, body: etree._Element) -> etree._Element:
+        # cei:issued always contains a date, so cei:chDesc is never empty
+        chdesc = etree.SubElement(body, _TAG_CH_DESC)
+        self._create_cei_abstract(chdesc)
+        self._create_cei_issued(chdesc)
+        self._create_cei_witness_orig(chdesc)
+        self._create_cei_diplomatic_analysis(chdesc)
+        if self._language is not None:
+            etree.SubElement(chdesc, _TAG_LANG_MOM).text = self._language
+        return chdesc
+
+    def _create_cei_date(self, issued: etree._Element) -> etree._Element:
         # An xml date
-        if isinstance(self.date, etree._Element):
-            return self.date
+        if isinstance(self._date, etree._Element):
+            return self._append_copy(issued, self._date)  # type: ignore
         # A date range tuple
-        if isinstance(self.date_value, Tuple):
-            return CEI.dateRange(
-                "{} - {}".format(
-                    self.date_value[0].to_value("fits", subfmt="longdate"),
-                    self.date_value[1].to_value("fits", subfmt="longdate"),
-                )
-                if self.date is None
-                else self.date,
-                {
-                    "from": to_mom_date_value(self.date_value[0]),
-                    "to": to_mom_date_value(self.date_value[1]),
-                },
+        if isinstance(self._date_value, tuple):
+            start, end = self._date_value
+            date = etree.SubElement(
+                issued,
+                _TAG_DATE_RANGE,
+                {"from": to_mom_date_value(start), "to": to_mom_date_value(end)},
             )
+            date.text = (
+                f"{to_long_date(start)} - {to_long_date(end)}"
+                if self._date is None
+                else self._date
+            )
+            return date
         # A single date value
-        if isinstance(self.date_value, Time):
-            return CEI.date(
-                self.date_value.to_value("fits", subfmt="longdate")
-                if self.date is None
-                else self.date,
-                {"value": to_mom_date_value(self.date_value)},
+        if self._date_value is not None:
+            date = etree.SubElement(
+                issued, _TAG_DATE, value=to_mom_date_value(self._date_value)
+            )
+            date.text = (
+                to_long_date(self._date_value) if self._date is None else self._date
             )
-        # Only a date text value
-        if isinstance(self.date, str):
-            return CEI.date(self.date, {"value": NO_DATE_VALUE})
-        # Nothing
-        return CEI.date(NO_DATE_TEXT, {"value": NO_DATE_VALUE})
-
-    def _create_cei_dimensions(self) -> Optional[etree._Element]:
-        return None if self.dimensions is None else CEI.dimensions(self.dimensions)
-
-    def _create_cei_diplomatic_analysis(self) -> Optional[etree._Element]:
-        children = join(
-            self._create_cei_list_bibl(),
-            self._create_cei_list_bibl_edition(),
-            self._create_cei_list_bibl_regest(),
-            self._create_cei_list_bibl_faksimile(),
-            self._create_cei_list_bibl_erw(),
-            self._create_cei_quote_originaldatierung(),
-            self._create_cei_p(),
+            return date
+        date = etree.SubElement(issued, _TAG_DATE, value=NO_DATE_VALUE)
+        # Only a date text value or nothing
+        date.text = self._date if isinstance(self._date, str) else NO_DATE_TEXT
+        return date
+
+    def _create_cei_diplomatic_analysis(
+        self, chdesc: etree._Element
+    ) -> Optional[etree._Element]:
+        if not (
+            self._literature
+            or self._literature_editions
+            or self._literature_abstracts
+            or self._literature_depictions
+            or self._literature_secondary
+            or self._date_quote is not None
+            or self._comments
+        ):
+            return None
+        diplomatic_analysis = etree.SubElement(chdesc, _TAG_DIPLOMATIC_ANALYSIS)
+        for tag, bibls in (
+            (_TAG_LIST_BIBL, self._literature),
+            (_TAG_LIST_BIBL_EDITION, self._literature_editions),
+            (_TAG_LIST_BIBL_REGEST, self._literature_abstracts),
+            (_TAG_LIST_BIBL_FAKSIMILE, self._literature_depictions),
+            (_TAG_LIST_BIBL_ERW, self._literature_secondary),
+        ):
+            if bibls:
+                self._create_cei_bibls(diplomatic_analysis, tag, bibls)
+        self._create_str_or_element(
+            diplomatic_analysis, _TAG_QUOTE_ORIGINALDATIERUNG, self._date_quote
         )
-        return CEI.diplomaticAnalysis(*children) if len(children) else None
+        for comment in self._comments:
+            etree.SubElement(diplomatic_analysis, _TAG_P).text = comment
+        return diplomatic_analysis
 
-    def _create_cei_div_notes(self) -> List[etree._Element]:
-        return (
-            CEI.divNotes(*[CEI.note(note) for note in self.footnotes])
-            if len(self.footnotes)
-            else []
+    def _create_cei_div_notes(self, back: etree._Element) -> Optional[etree._Element]:
+        if not self._footnotes:
+            return None
+        div_notes = etree.SubElement(back, _TAG_DIV_NOTES)
+        for note in self._footnotes:
+            etree.SubElement(div_notes, _TAG_NOTE).text = note
+        return div_notes
+
+    def _create_cei_idno(self, body: etree._Element) -> etree._Element:
+        idno = (
+            etree.SubElement(body, _TAG_IDNO, id=self.id_norm, old=self._id_old)
+            if self._id_old
+            else etree.SubElement(body, _TAG_IDNO, id=self.id_norm)
         )
-
-    def _create_cei_figures(self) -> List[etree._Element]:
-        return (
-            [CEI.figure(CEI.graphic({"url": url})) for url in self.graphic_urls]
-            if len(self.graphic_urls)
-            else []
+        idno.text = self._id_text
+        return idno
+
+    def _create_cei_issued(self, chdesc: etree._Element) -> etree._Element:
+        issued = etree.SubElement(chdesc, _TAG_ISSUED)
+        self._create_str_or_element(issued, _TAG_PLACE_NAME, self._issued_place)
+        self._create_cei_date(issued)
+        return issued
+
+    def _create_cei_issuers(self, abstract: etree._Element) -> None:
+        issuers = (
+            self._issuers if isinstance(self._issuers, tuple) else (self._issuers,)
         )
+        for issuer in issuers:
+            self._create_str_or_element(abstract, _TAG_ISSUER, issuer)
 
-    def _create_cei_front(self) -> etree._Element:
-        children = join(self._create_cei_source_desc())
-        return CEI.front(*children)
-
-    def _create_cei_idno(self) -> etree._Element:
-        attributes = {"id": self.id_norm}
-        if self.id_old:
-            attributes["old"] = self.id_old
-        return CEI.idno(self.id_text, **attributes)
-
-    def _create_cei_issued(self) -> Optional[etree._Element]:
-        children = join(
-            self._create_cei_place_name(self.issued_place), self._create_cei_date()
-        )
-        return CEI.issued(*children) if len(children) else None
-
-    def _create_cei_issuers(self) -> List[etree._Element]:
-        if self.issuers is None:
-            return []
-        elif isinstance(self.issuers, str):
-            return [CEI.issuer(self.issuers)]
-        elif isinstance(self.issuers, List):
-            return [
-                CEI.issuer(issuer) if isinstance(issuer, str) else issuer
-                for issuer in self.issuers
-            ]
+    def _create_cei_pers_name(
+        self,
+        back: etree._Element,
+        value: str | etree._Element,
+        type: Optional[str] = None,
+    ) -> etree._Element:
+        if isinstance(value, str):
+            pers_name = etree.SubElement(back, _TAG_PERS_NAME)
+            if type is not None:
+                pers_name.set("type", type)
+            pers_name.text = value
+            return pers_name
+        pers_name = self._append_copy(back, value)
+        if type is not None:
+            pers_name.set("type", type)  # type: ignore
+        return pers_name  # type: ignore
+
+    def _create_cei_physical_desc(
+        self, witness_orig: etree._Element
+    ) -> Optional[etree._Element]:
+        if (
+            self._material is None
+            and self._dimensions is None
+            and self._condition is None
+        ):
+            return None
+        physical_desc = etree.SubElement(witness_orig, _TAG_PHYSICAL_DESC)
+        if self._material is not None:
+            etree.SubElement(physical_desc, _TAG_MATERIAL).text = self._material
+        if self._dimensions is not None:
+            etree.SubElement(physical_desc, _TAG_DIMENSIONS).text = self._dimensions
+        if self._condition is not None:
+            etree.SubElement(physical_desc, _TAG_CONDITION).text = self._condition
+        return physical_desc
+
+    def _create_cei_seal_desc(self, auth: etree._Element) -> Optional[etree._Element]:
+        if self._seals is None:
+            return None
+        elif isinstance(self._seals, etree._Element):
+            return self._append_copy(auth, self._seals)
+        seal_desc = etree.SubElement(auth, _TAG_SEAL_DESC)
+        if isinstance(self._seals, str):
+            seal_desc.text = self._seals
+        elif isinstance(self._seals, Seal):
+            # Seal.to_xml appends a sigillant element without copying it
+            seal_desc.append(deepcopy(self._seals.to_xml()))
         else:
-            return [self.issuers]
-
-    def _create_cei_lang_mom(self) -> Optional[etree._Element]:
-        return None if self.language is None else CEI.lang_MOM(self.language)
-
-    def _create_cei_list_bibl(self) -> Optional[etree._Element]:
-        return (
-            CEI.listBibl(*self._create_cei_bibls(self.literature))
-            if len(self.literature)
-            else None
-        )
-
-    def _create_cei_list_bibl_edition(self) -> Optional[etree._Element]:
-        return (
-            CEI.listBiblEdition(*self._create_cei_bibls(self.literature_editions))
-            if len(self.literature_editions)
-            else None
-        )
-
-    def _create_cei_list_bibl_erw(self) -> Optional[etree._Element]:
-        return (
-            CEI.listBiblErw(*self._create_cei_bibls(self.literature_secondary))
-            if len(self.literature_secondary)
-            else None
-        )
-
-    def _create_cei_list_bibl_faksimile(self) -> Optional[etree._Element]:
-        return (
-            CEI.listBiblFaksimile(*self._create_cei_bibls(self.literature_depictions))
-            if len(self.literature_depictions)
-            else None
-        )
-
-    def _create_cei_list_bibl_regest(self) -> Optional[etree._Element]:
-        return (
-            CEI.listBiblRegest(*self._create_cei_bibls(self.literature_abstracts))
-            if len(self.literature_abstracts)
-            else None
-        )
-
-    def _create_cei_material(self) -> Optional[etree._Element]:
-        return None if self.material is None else CEI.material(self.material)
-
-    def _create_cei_nota(self) -> List[etree._Element]:
-        return [CEI.nota(nota) for nota in self.chancellary_remarks]
-
-    def _create_cei_notarius_desc(self) -> Optional[etree._Element]:
-        return (
-            self.notarial_authentication
-            if self.notarial_authentication is None
-            or isinstance(self.notarial_authentication, etree._Element)
-            else CEI.notariusDesc(self.notarial_authentication)
-        )
-
-    def _create_cei_geog_name(
-        self, value: Optional[str | etree._Element]
+            # List of strings or Seal objects
+            for desc in self._seals:
+                if isinstance(desc, str):
+                    etree.SubElement(seal_desc, _TAG_SEAL).text = desc
+                else:
+                    seal_desc.append(deepcopy(desc.to_xml()))
+        return seal_desc
+
+    def _create_cei_source_desc(
+        self, front: etree._Element
     ) -> Optional[etree._Element]:
-        return CEI.geogName(value) if isinstance(value, str) else value
+        if not self._abstract_sources and not self._transcription_sources:
+            return None
+        source_desc = etree.SubElement(front, _TAG_SOURCE_DESC)
+        if self._abstract_sources:
+            self._create_cei_bibls(
+                source_desc, _TAG_SOURCE_DESC_REGEST, self._abstract_sources
+            )
+        if self._transcription_sources:
+            self._create_cei_bibls(
+                source_desc, _TAG_SOURCE_DESC_VOLLTEXT, self._transcription_sources
+            )
+        return source_desc
+
+    def _create_cei_text(self) -> etree._Element:
+        # Every charter has the same skeleton, copying it is cheaper than building it
+        text = deepcopy(_TEXT_TEMPLATE)
+        front, body, back = text
+        self._populate_cei_front(front)
+        self._populate_cei_body(body)
+        self._populate_cei_back(back)
+        return text
 
-    def _create_cei_index(
-        self, value: Optional[str | etree._Element]
+    def _create_cei_witness_orig(
+        self, chdesc: etree._Element
     ) -> Optional[etree._Element]:
-        return CEI.index(value) if isinstance(value, str) else value
-
-    def _create_cei_org_name(
-        self, value: Optional[str | etree._Element]
+        witness_orig = etree.SubElement(chdesc, _TAG_WITNESS_ORIG)
+        if self._tradition:
+            etree.SubElement(witness_orig, _TAG_TRADITIO_FORM).text = self._tradition
+        self._create_cei_arch_identifier(witness_orig)
+        self._create_cei_auth(witness_orig)
+        self._create_cei_physical_desc(witness_orig)
+        for nota in self._chancellary_remarks:
+            etree.SubElement(witness_orig, _TAG_NOTA).text = nota
+        for url in self._graphic_urls:
+            figure = etree.SubElement(witness_orig, _TAG_FIGURE)
+            etree.SubElement(figure, _TAG_GRAPHIC, url=url)
+        return self._keep_if_not_empty(chdesc, witness_orig)
+
+    def _create_str_or_element(
+        self,
+        parent: etree._Element,
+        tag: str,
+        value: Optional[str | etree._Element],
     ) -> Optional[etree._Element]:
-        return CEI.orgName(value) if isinstance(value, str) else value
-
-    def _create_cei_p(self) -> List[etree._Element]:
-        return (
-            [CEI.p(comment) for comment in self.comments] if len(self.comments) else []
-        )
+        # Texts are wrapped in a new element, complete elements are copied
+        if isinstance(value, str):
+            element = etree.SubElement(parent, tag)
+            element.text = value
+            return element
+        return self._append_copy(parent, value)
 
-    def _create_cei_pers_name(
-        self, value: Optional[str | etree._Element], type: Optional[str] = None
+    def _append_copy(
+        self, parent: etree._Element, value: Optional[etree._Element]
     ) -> Optional[etree._Element]:
-        if isinstance(value, str):
-            attributes = {}
-            if type is not None:
-                attributes["type"] = type
-            return CEI.persName(value, attributes)
-        elif isinstance(value, etree._Element):
-            if type is not None:
-                value.set("type", type)
-            return value
-        else:
+        # The tree is cached, so elements owned by the caller are copied instead of
+        # moved into it. Otherwise building another charter with the same element
+        # would take it away from this charter's tree.
+        if value is None:
             return None
+        element = deepcopy(value)
+        parent.append(element)
+        return element
 
-    def _create_cei_physical_desc(self) -> Optional[etree._Element]:
-        children = join(
-            self._create_cei_material(),
-            self._create_cei_dimensions(),
-            self._create_cei_condition(),
-        )
-        return CEI.physicalDesc(*children) if len(children) else None
-
-    def _create_cei_place_name(
-        self, value: Optional[str | etree._Element]
+    def _keep_if_not_empty(
+        self, parent: etree._Element, element: etree._Element
     ) -> Optional[etree._Element]:
-        return CEI.placeName(value) if isinstance(value, str) else value
-
-    def _create_cei_quote_originaldatierung(self) -> Optional[etree._Element]:
-        return (
-            self.date_quote
-            if self.date_quote is None or isinstance(self.date_quote, etree._Element)
-            else CEI.quoteOriginaldatierung(self.date_quote)
-        )
+        # Containers are created before their content, empty ones are removed again
+        if len(element):
+            return element
+        parent.remove(element)
+        return None
+
+    def _populate_cei_back(self, back: etree._Element) -> None:
+        for person in self._witnesses:
+            self._create_cei_pers_name(back, person, type="Zeuge")
+        for person in self._index_persons:
+            self._create_cei_pers_name(back, person)
+        for organization in self._index_organizations:
+            self._create_str_or_element(back, _TAG_ORG_NAME, organization)
+        for place in self._index_places:
+            self._create_str_or_element(back, _TAG_PLACE_NAME, place)
+        for geo_feature in self._index_geo_features:
+            self._create_str_or_element(back, _TAG_GEOG_NAME, geo_feature)
+        for term in self._index:
+            self._create_str_or_element(back, _TAG_INDEX, term)
+        self._create_cei_div_notes(back)
+
+    def _populate_cei_body(self, body: etree._Element) -> None:
+        self._create_cei_idno(body)
+        self._create_cei_chdesc(body)
+        self._create_str_or_element(body, _TAG_TENOR, self._transcription)
+
+    def _populate_cei_front(self, front: etree._Element) -> None:
+        self._create_cei_source_desc(front)
 
-    def _create_cei_recipient(self) -> Optional[etree._Element]:
-        return (
-            None
-            if self.recipient is None
-            else (
-                CEI.recipient(self.recipient)
-                if isinstance(self.recipient, str)
-                else self.recipient
-            )
-        )
+    # --------------------------------------------------------------------#
+    #                              Caching                               #
+    # --------------------------------------------------------------------#
 
-    def _create_cei_ref(self) -> Optional[etree._Element]:
+    def __getstate__(self) -> Dict[str, Any]:
+        # The caches are left out of copies and pickles, lxml elements can't be pickled
+        return {
+            name: getattr(self, name)
+            for name in self.__slots__
+            if name not in _CACHE_SLOTS
+        }
+
+    def __setstate__(self, state: Dict[str, Any]) -> None:
+        self._clear_cache()
+        for name, value in state.items():
+            object.__setattr__(self, name, value)
+
+    def _build(self) -> etree._Element:
+        """Returns the cached xml tree of the charter, creating it if the charter changed since the last call."""
+        if self._xml is None:
+            self._xml = self._create_cei_text()
+        return self._xml
+
+    def _serializable_xml(self, add_schema_location: bool = False) -> etree._Element:
+        # The cached tree is only read while serializing, so it doesn't need to be copied
+        return self.to_xml(True) if add_schema_location else self._build()
+
+    def _has_cache(self) -> bool:
         return (
-            None
-            if self.external_link is None
-            else CEI.ref({"target": self.external_link})
+            self._xml is not None
+            or self._id_norm_quoted is not None
+            or self._date_value_time is not None
         )
 
-    def _create_cei_seal_desc(self) -> Optional[etree._Element]:
-        if self.seals is None:
-            return None
-        elif isinstance(self.seals, etree._Element):
-            return self.seals
-        elif isinstance(self.seals, str):
-            return CEI.sealDesc(self.seals)
-        elif isinstance(self.seals, Seal):
-            return CEI.sealDesc(self.seals.to_xml())
-        else:
-            # List of strings or Seal objects
-            return CEI.sealDesc(
-                *[
-                    CEI.seal(desc) if isinstance(desc, str) else desc.to_xml()
-                    for desc in self.seals
-                ]
-            )
+    def _clear_cache(self):
+        object.__setattr__(self, "_date_value_time", None)
+        object.__setattr__(self, "_id_norm_quoted", None)
+        object.__setattr__(self, "_xml", None)
 
-    def _create_cei_source_desc(self) -> Optional[etree._Element]:
-        children = []
-        if self.abstract_sources:
-            children.append(
-                CEI.sourceDescRegest(*self._create_cei_bibls(self.abstract_sources))
-            )
-        if self.transcription_sources:
-            children.append(
-                CEI.sourceDescVolltext(
-                    *self._create_cei_bibls(self.transcription_sources)
-                )
-            )
-        return CEI.sourceDesc(*children) if len(children) else None
+    # --------------------------------------------------------------------#
+    #                           Public methods                           #
+    # --------------------------------------------------------------------#
 
-    def _create_cei_tenor(self) -> Optional[etree._Element]:
-        return (
-            self.transcription
-            if self.transcription is None
-            or isinstance(self.transcription, etree._Element)
-            else CEI.tenor(self.transcription)
-        )
+    @classmethod
+    def from_records(cls, records: Iterable[Dict[str, Any]]) -> List[Charter]:
+        """Creates many charters at once from dictionaries of constructor arguments. All iso date strings with a time of day in the date values are converted to astropy.Time objects in a single call instead of one call per charter.
 
-    def _create_cei_text(self, add_schema_location: bool = False) -> etree._Element:
-        text = CEI.text(
-            self._create_cei_front(),
-            self._create_cei_body(),
-            self._create_cei_back(),
-            type="charter",
-        )
-        if add_schema_location:
-            text.attrib.update(CEI_SCHEMA_LOCATION_ATTRIBUTE)
-        return text
+        Args:
+            records: The keyword arguments for each charter, for instance {"id_text": "1", "date_value": "1307-02-22"}.
 
-    def _create_cei_traditio_form(self) -> Optional[etree._Element]:
-        return None if not self._tradition else CEI.traditioForm(self._tradition)
-
-    def _create_cei_witness_orig(self) -> Optional[etree._Element]:
-        children = join(
-            self._create_cei_traditio_form(),
-            self._create_cei_arch_identifier(),
-            self._create_cei_auth(),
-            self._create_cei_physical_desc(),
-            self._create_cei_nota(),
-            self._create_cei_figures(),
-        )
-        return CEI.witnessOrig(*children) if len(children) else None
+        Returns:
+            A list with one charter per record, in the order of the input.
 
-    # --------------------------------------------------------------------#
-    #                           Public methods                           #
-    # --------------------------------------------------------------------#
+        Raises:
+            ValueError: If any record contains invalid values.
+        """
+        records = [dict(record) for record in records]
+        # Positions of all iso date-time strings as (record index, tuple index or None)
+        positions: List[Tuple[int, Optional[int]]] = []
+        values: List[str] = []
+        for index, record in enumerate(records):
+            value = record.get("date_value")
+            if isinstance(value, str) and _needs_time_class(value):
+                positions.append((index, None))
+                values.append(value)
+            elif (
+                isinstance(value, tuple)
+                and len(value) == 2
+                and isinstance(value[0], str)
+                and isinstance(value[1], str)
+                and _needs_time_class(value[0])
+                and _needs_time_class(value[1])
+            ):
+                positions.extend(((index, 0), (index, 1)))
+                values.extend(value)
+        if values:
+            try:
+                times = _time_class()(values, format="isot", scale="ut1")
+            except Exception:
+                # Leave the conversion and its error reporting to the single charters
+                times = None
+            if times is not None:
+                for (index, part), time in zip(positions, times):
+                    if part is None:
+                        records[index]["date_value"] = time
+                    else:
+                        value = records[index]["date_value"]
+                        records[index]["date_value"] = (
+                            (time, value[1]) if part == 0 else (value[0], time)
+                        )
+        return [cls(**record) for record in records]
 
     def to_xml(self, add_schema_location: bool = False) -> etree._Element:
-        """Creates an xml representation of the charter.
+        """Creates an xml representation of the charter. The tree is built once and only rebuilt after a property has been set, every call returns an independent copy of it. List values are stored as tuples, so they can only be changed by setting the property. Elements and Seal objects modified in place after they have been set are only picked up once the property is set again.
 
         Args:
             add_schema_location: If True, the CEI schema location is added to the root element.
@@ -1086,17 +1471,27 @@ class Charter(XmlAssembler):
         Returns:
             An etree Element object representing the charter.
         """
-        return self._create_cei_text(add_schema_location)
+        text = deepcopy(self._build())
+        if add_schema_location:
+            text.attrib.update(CEI_SCHEMA_LOCATION_ATTRIBUTE)
+        return text
 
-    def to_file(self, folder: Optional[str] = None, add_schema_location: bool = False):
+    def to_file(
+        self,
+        folder: Optional[str] = None,
+        add_schema_location: bool = False,
+        pretty: bool = True,
+    ):
         """Writes the xml representation of the charter to a file. The filename is generated from the normalized charter id.
 
         Args:
             folder (str): The folder to write the file to. If this is ommitted, the file is written to the place where the script is executed from.
             add_schema_location (bool): If True, the CEI schema location is added to the root element. Defaults to False.
+            pretty (bool): If True, the xml is indented for human readers. Defaults to True.
         """
         return super(Charter, self).to_file(
             self.id_norm + ".cei",
             folder=folder,
             add_schema_location=add_schema_location,
+            pretty=pretty,
         )
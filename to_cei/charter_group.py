@@ -3,20 +3,30 @@ from typing import List, Optional
 from lxml import etree
 
 from to_cei.charter import Charter
-from to_cei.config import CEI, CEI_SCHEMA_LOCATION_ATTRIBUTE
+from to_cei.config import CEI_NS, CEI_SCHEMA_LOCATION_ATTRIBUTE, CHARTER_NSS
 from to_cei.xml_assembler import XmlAssembler
 
+_TAG_CEI = f"{{{CEI_NS}}}cei"
+_TAG_FILE_DESC = f"{{{CEI_NS}}}fileDesc"
+_TAG_GROUP = f"{{{CEI_NS}}}group"
+_TAG_TEI_HEADER = f"{{{CEI_NS}}}teiHeader"
+_TAG_TEXT = f"{{{CEI_NS}}}text"
+_TAG_TITLE = f"{{{CEI_NS}}}title"
+_TAG_TITLE_STMT = f"{{{CEI_NS}}}titleStmt"
+
 
 class CharterGroup(XmlAssembler):
-    _charters: List[Charter] = []
-    _name: str = ""
+    __slots__ = ("_charters", "_name")
+
+    _charters: List[Charter]
+    _name: str
 
-    def __init__(self, name: str, charters: List[Charter] = []):
+    def __init__(self, name: str, charters: Optional[List[Charter]] = None):
         """Creates a new charter group object.
 
         Args:
             name (str): The name of the charter group. Is not allowed to be empty
-            charters(List[Charter] = []): An optional list of Charter objects
+            charters(Optional[List[Charter]] = None): An optional list of Charter objects
         """
         self.name = name
         self.charters = charters
@@ -26,8 +36,8 @@ class CharterGroup(XmlAssembler):
         return self._charters
 
     @charters.setter
-    def charters(self, value: List[Charter]):
-        self._charters = value
+    def charters(self, value: Optional[List[Charter]] = None):
+        self._charters = [] if value is None else value
 
     @property
     def name(self):
@@ -48,23 +58,34 @@ class CharterGroup(XmlAssembler):
         Returns:
             An etree Element object representing the charter group.
         """
-        cei = CEI.cei(
-            CEI.teiHeader(CEI.fileDesc(CEI.titleStmt(CEI.title(self.name)))),
-            CEI.text(CEI.group(*[charter.to_xml() for charter in self.charters])),
+        cei = etree.Element(_TAG_CEI, nsmap=CHARTER_NSS)
+        tei_header = etree.SubElement(cei, _TAG_TEI_HEADER)
+        title_stmt = etree.SubElement(
+            etree.SubElement(tei_header, _TAG_FILE_DESC), _TAG_TITLE_STMT
         )
+        etree.SubElement(title_stmt, _TAG_TITLE).text = self.name
+        group = etree.SubElement(etree.SubElement(cei, _TAG_TEXT), _TAG_GROUP)
+        group.extend(charter.to_xml() for charter in self.charters)
         if add_schema_location:
             cei.attrib.update(CEI_SCHEMA_LOCATION_ATTRIBUTE)
         return cei
 
-    def to_file(self, folder: Optional[str] = None, add_schema_location: bool = False):
+    def to_file(
+        self,
+        folder: Optional[str] = None,
+        add_schema_location: bool = False,
+        pretty: bool = True,
+    ):
         """Writes the xml representation of the charter group to a file. The filename is generated from a normalization of the group name.
 
         Args:
             folder (str): The folder to write the file to. If this is ommitted, the file is written to the place where the script is executed from.
             add_schema_location (bool): If True, the CEI schema location is added to the root element. Defaults to False.
+            pretty (bool): If True, the xml is indented for human readers. Defaults to True.
         """
         return super(CharterGroup, self).to_file(
             self.name.lower().replace(" ", "_") + ".cei.group",
             folder=folder,
             add_schema_location=add_schema_location,
+            pretty=pretty,
         )
@@ -1,29 +1,103 @@
 import os
 import shelve
 from pathlib import Path
-from typing import Optional
+from typing import Dict, Optional, Set, Tuple
 
 import requests
+import xmlschema
+
+LAST_MODIFIED_KEY_PREFIX = "last-modified:"
+# Seconds to wait for the server when revalidating, the cached content is used otherwise
+REVALIDATE_TIMEOUT = 5
 
 
 class FileCache:
     __shelf: shelve.Shelf
+    __files: Dict[str, Tuple[Tuple[int, int], str]]
+    __revalidated: Set[str]
+    __schemas: Dict[str, Tuple[str, xmlschema.XMLSchema11]]
 
     def __init__(self, base: str = str(Path.home().joinpath(".cache", "to-cei"))):
         if not os.path.isdir(base):
             os.makedirs(base)
         file = os.path.join(base, "cache")
         self.__shelf = shelve.open(file, writeback=True)
+        self.__files = {}
+        self.__revalidated = set()
+        self.__schemas = {}
 
     def __exit__(self):
         self.__shelf.close()
 
+    def __get_file(self, path: str) -> str:
+        # Local files are only read again if their modification time or size changed
+        stat = os.stat(path)
+        key = (stat.st_mtime_ns, stat.st_size)
+        entry = self.__files.get(path)
+        if entry is not None and entry[0] == key:
+            return entry[1]
+        with open(path, encoding="utf-8") as file:
+            text = file.read()
+        self.__files[path] = (key, text)
+        return text
+
+    def __store(self, url: str, response: requests.Response) -> str:
+        self.__shelf[url] = response.text
+        last_modified = response.headers.get("Last-Modified")
+        if last_modified:
+            self.__shelf[LAST_MODIFIED_KEY_PREFIX + url] = last_modified
+        self.__revalidated.add(url)
+        return response.text
+
+    def __revalidate(self, url: str):
+        # Entries from earlier sessions are checked once per session with a
+        # conditional request, the cached content is kept if the server is unreachable
+        self.__revalidated.add(url)
+        last_modified = self.__shelf.get(LAST_MODIFIED_KEY_PREFIX + url)
+        if last_modified is None:
+            return
+        try:
+            with requests.get(
+                url,
+                headers={"If-Modified-Since": last_modified},
+                timeout=REVALIDATE_TIMEOUT,
+            ) as response:
+                if response.status_code == 200:
+                    self.__store(url, response)
+        except requests.RequestException:
+            pass
+
     def get(self, url: str, force: bool = False) -> Optional[str]:
+        if os.path.isfile(url):
+            return self.__get_file(url)
         if url not in self.__shelf or force == True:
             with requests.get(url) as response:
-                self.__shelf[url] = response.text
-                return response.text
+                return self.__store(url, response)
         else:
+            if url not in self.__revalidated:
+                self.__revalidate(url)
             text = self.__shelf[url]
             assert isinstance(text, str)
             return text
+
+    def get_schema(
+        self, url: str, force: bool = False
+    ) -> Optional[xmlschema.XMLSchema11]:
+        """Returns the compiled XSD 1.1 schema of a cached url or local file. The schema is only compiled again if its content changed since the last call.
+
+        Args:
+            url (str): The url or local path of the xsd file.
+            force (bool): If True, the content is downloaded again even if it is already cached.
+
+        Returns:
+            The compiled schema or None if there is no content.
+        """
+        text = self.get(url, force)
+        if not text:
+            return None
+        entry = self.__schemas.get(url)
+        if entry is not None and entry[0] == text:
+            return entry[1]
+        schema = xmlschema.XMLSchema11(text)
+        self.__schemas[url] = (text, schema)
+        return schema
@@ -1,9 +1,12 @@
-from typing import List, Optional
+from typing import Iterable, List, Optional
 
 from lxml import etree
 
 from to_cei.config import CEI_NS
 
+# Clark-notation prefix of all tags in the CEI namespace
+_CEI_TAG_PREFIX = f"{{{CEI_NS}}}"
+
 
 def join(
     *values: Optional[etree._Element | List[etree._Element]],
@@ -13,46 +16,53 @@ def join(
     for value in values:
         if isinstance(value, etree._Element):
             all.append(value)
-        elif isinstance(value, List) and len(value):
+        elif isinstance(value, list) and len(value):
             all = all + value
     return all
 
 
 def ln(element: etree._Element) -> str:
     """Get the local name of an element."""
-    return etree.QName(element.tag).localname
+    # Tags are stored in Clark notation, so no QName object is needed to split them
+    tag = element.tag
+    return tag[tag.rfind("}") + 1 :] if tag[0] == "{" else tag
 
 
-def ns(element: etree._Element) -> str:
+def ns(element: etree._Element) -> Optional[str]:
     """Get the namespace of an element."""
-    return etree.QName(element.tag).namespace
+    tag = element.tag
+    return tag[1 : tag.rfind("}")] if tag[0] == "{" else None
 
 
 def get_str(value: Optional[str] = None) -> Optional[str]:
     return value if value is not None and len(value) else None
 
 
-def get_str_list(value: Optional[str | List[str]] = []) -> List[str]:
-    return (
-        []
-        if value is None or (isinstance(value, str) and not len(value))
-        else (value if isinstance(value, List) else [value])
-    )
+def get_str_list(value: Optional[str | Iterable[str]] = None) -> List[str]:
+    if value is None:
+        return []
+    if isinstance(value, str):
+        return [value] if len(value) else []
+    return list(value)
 
 
 def get_str_or_element(
     value: Optional[str | etree._Element], *tags: str
 ) -> Optional[str | etree._Element]:
-    if isinstance(value, str) and not len(value):
+    # Most values are None or plain texts, so they are handled before any lxml check
+    if value is None:
         return None
+    if isinstance(value, str):
+        return value if len(value) else None
     if isinstance(value, etree._Element):
-        if ns(value) != CEI_NS:
+        tag = value.tag
+        if not tag.startswith(_CEI_TAG_PREFIX):
             raise ValueError(
                 "Provided element needs to be in the CEI namespace but instead is in '{}'".format(
                     ns(value)
                 )
             )
-        if ln(value) not in tags:
+        if tag[len(_CEI_TAG_PREFIX) :] not in tags:
             raise ValueError(
                 "Provided element needs to be one of '{}', but instead is '{}'".format(
                     ", ".join(tags), ln(value)
@@ -2,23 +2,32 @@ from typing import List, Optional, Tuple
 
 from lxml import etree
 
-from to_cei.config import CEI
+from to_cei.config import CEI_NS, CHARTER_NSS
 from to_cei.helpers import get_str, get_str_or_element
 from to_cei.xml_assembler import XmlAssembler
 
+_TAG_LEGEND = f"{{{CEI_NS}}}legend"
+_TAG_SEAL = f"{{{CEI_NS}}}seal"
+_TAG_SEAL_CONDITION = f"{{{CEI_NS}}}sealCondition"
+_TAG_SEAL_DIMENSIONS = f"{{{CEI_NS}}}sealDimensions"
+_TAG_SEAL_MATERIAL = f"{{{CEI_NS}}}sealMaterial"
+_TAG_SIGILLANT = f"{{{CEI_NS}}}sigillant"
+
 
 class Seal(XmlAssembler):
-    _condition: Optional[str] = None
-    _dimensions: Optional[str] = None
-    _legend: Optional[str] | List[Tuple[str, str]] = []
-    _material: Optional[str] = None
-    _sigillant: Optional[str | etree._Element] = None
+    __slots__ = ("_condition", "_dimensions", "_legend", "_material", "_sigillant")
+
+    _condition: Optional[str]
+    _dimensions: Optional[str]
+    _legend: str | List[Tuple[str, str]]
+    _material: Optional[str]
+    _sigillant: Optional[str | etree._Element]
 
     def __init__(
         self,
         condition: Optional[str] = None,
         dimensions: Optional[str] = None,
-        legend: Optional[str | List[Tuple[str, str]]] = [],
+        legend: Optional[str | List[Tuple[str, str]]] = None,
         material: Optional[str] = None,
         sigillant: Optional[str | etree._Element] = None,
     ) -> None:
@@ -68,7 +77,7 @@ class Seal(XmlAssembler):
         return self._legend
 
     @legend.setter
-    def legend(self, value: Optional[str | List[Tuple[str, str]]] = []):
+    def legend(self, value: Optional[str | List[Tuple[str, str]]] = None):
         self._legend = (
             []
             if value is None or (isinstance(value, str) and not len(value))
@@ -96,19 +105,20 @@ class Seal(XmlAssembler):
     # --------------------------------------------------------------------#
 
     def to_xml(self) -> Optional[etree._Element]:
-        children = []
+        seal = etree.Element(_TAG_SEAL, nsmap=CHARTER_NSS)
         if self.condition is not None:
-            children.append(CEI.sealCondition(self.condition))
+            etree.SubElement(seal, _TAG_SEAL_CONDITION).text = self.condition
         if self.dimensions is not None:
-            children.append(CEI.sealDimensions(self.dimensions))
+            etree.SubElement(seal, _TAG_SEAL_DIMENSIONS).text = self.dimensions
         if isinstance(self.legend, str):
-            children.append(CEI.legend(self.legend))
-        if isinstance(self.legend, List):
-            children = children + [
-                CEI.legend(legend[1], {"place": legend[0]}) for legend in self.legend
-            ]
+            etree.SubElement(seal, _TAG_LEGEND).text = self.legend
+        if isinstance(self.legend, list):
+            for place, legend in self.legend:
+                etree.SubElement(seal, _TAG_LEGEND, place=place).text = legend
         if self.material is not None:
-            children.append(CEI.sealMaterial(self.material))
-        if self.sigillant is not None:
-            children.append(CEI.sigillant(self.sigillant))
-        return CEI.seal(*children) if len(children) else None
+            etree.SubElement(seal, _TAG_SEAL_MATERIAL).text = self.material
+        if isinstance(self.sigillant, str):
+            etree.SubElement(seal, _TAG_SIGILLANT).text = self.sigillant
+        elif self.sigillant is not None:
+            etree.SubElement(seal, _TAG_SIGILLANT).append(self.sigillant)
+        return seal if len(seal) else None
@@ -1,7 +1,6 @@
 from enum import Enum
 from typing import Any
 
-import xmlschema
 from lxml import etree
 
 from to_cei import config
@@ -13,9 +12,8 @@ class Schema(str, Enum):
 
 class Validator:
     def __validate(self, element: etree._Element, schema: Schema) -> None:
-        xsd_content = config.file_cache.get(schema.value)
-        if xsd_content:
-            xsd = xmlschema.XMLSchema11(xsd_content)
+        xsd = config.file_cache.get_schema(schema.value)
+        if xsd is not None:
             resource: Any = element
             xsd.validate(resource)
 
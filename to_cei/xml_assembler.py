@@ -1,28 +1,36 @@
 import os
+import warnings
 from abc import ABC, abstractmethod
 from pathlib import Path
-from typing import List, Optional
+from typing import BinaryIO, List, Optional
 
 from lxml import etree
 
-from to_cei.config import CEI_PREFIX
-
 
 class XmlAssembler(ABC):
+    __slots__ = ()
+
     @abstractmethod
     def to_xml(self, add_schema_location: bool = False) -> Optional[etree._Element]:
         pass
 
-    def to_string(self, add_schema_location: bool = False) -> str:
+    def _serializable_xml(
+        self, add_schema_location: bool = False
+    ) -> Optional[etree._Element]:
+        """Returns the xml to serialize. Subclasses that keep a cached tree can return it directly as it will only be read."""
+        return self.to_xml(add_schema_location)
+
+    def to_string(self, add_schema_location: bool = False, pretty: bool = False) -> str:
         """Serializes the xml representation of the object to a string.
 
         Args:
             add_schema_location: If True, the CEI schema location is added to the root element.
+            pretty: If True, the xml is indented for human readers.
 
         Returns:
             A string representation of the object.
         """
-        xml = self.to_xml(add_schema_location)
+        xml = self._serializable_xml(add_schema_location)
         return (
             ""
             if xml is None
@@ -30,19 +38,46 @@ class XmlAssembler(ABC):
                 etree.tostring(
                     xml,
                     encoding="unicode",
-                    pretty_print=True,
+                    pretty_print=pretty,
                 )
             )
         )
 
+    def to_bytes(
+        self, add_schema_location: bool = False, pretty: bool = False
+    ) -> bytes:
+        """Serializes the xml representation of the object to UTF-8 encoded bytes. Use this instead of to_string when the result is written to a file or a socket anyway.
+
+        Args:
+            add_schema_location: If True, the CEI schema location is added to the root element.
+            pretty: If True, the xml is indented for human readers.
+
+        Returns:
+            A UTF-8 encoded representation of the object.
+        """
+        xml = self._serializable_xml(add_schema_location)
+        return (
+            b""
+            if xml is None
+            else etree.tostring(xml, encoding="UTF-8", pretty_print=pretty)
+        )
+
     def to_file(
         self,
         name: str,
         folder: Optional[str | Path] = None,
-        inclusive_ns_prefixes: List[str] = [],
+        inclusive_ns_prefixes: Optional[List[str]] = None,
         add_schema_location: bool = False,
+        pretty: bool = True,
     ):
-        xml = self.to_xml(add_schema_location)
+        if inclusive_ns_prefixes is not None:
+            # It only ever applied to exclusive C14N output, which to_file doesn't write
+            warnings.warn(
+                "The 'inclusive_ns_prefixes' parameter is deprecated and has no effect on the written file, it will be removed in future versions.",
+                DeprecationWarning,
+                stacklevel=2,
+            )
+        xml = self._serializable_xml(add_schema_location)
         if xml is None:
             raise Exception("Failed to read xml")
         folder = (
@@ -55,11 +90,25 @@ class XmlAssembler(ABC):
             )
         )
         os.makedirs(folder, exist_ok=True)
-        etree.ElementTree(xml).write(
-            os.path.join(folder, name + ".xml"),
-            encoding="UTF-8",
-            pretty_print=True,
-            inclusive_ns_prefixes=[CEI_PREFIX] + inclusive_ns_prefixes,
-            xml_declaration=True,
-            standalone=False,
-        )
+        with open(os.path.join(folder, name + ".xml"), "wb", buffering=1 << 20) as file:
+            self._write_xml(file, xml, pretty)
+
+    def write(
+        self, file: BinaryIO, add_schema_location: bool = False, pretty: bool = True
+    ):
+        """Streams the xml representation of the object including the xml declaration into a binary file object, for instance to write many objects into one open file or socket without serializing them into memory first.
+
+        Args:
+            file: The binary file object to write to.
+            add_schema_location: If True, the CEI schema location is added to the root element.
+            pretty: If True, the xml is indented for human readers.
+        """
+        xml = self._serializable_xml(add_schema_location)
+        if xml is None:
+            raise Exception("Failed to read xml")
+        self._write_xml(file, xml, pretty)
+
+    def _write_xml(self, file: BinaryIO, xml: etree._Element, pretty: bool):
+        with etree.xmlfile(file, encoding="UTF-8") as xf:
+            xf.write_declaration(standalone=False)
+            xf.write(xml, pretty_print=pretty)